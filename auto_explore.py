@@ -1,51 +1,221 @@
-import os
 import sys
-import subprocess
-import time
+import asyncio
+import argparse
+import json
+import os
 from pathlib import Path
+from typing import Callable, List, Optional
+from datetime import datetime
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from rich.progress import Progress
+
+from utils.fdom.interaction_utils import MANUAL_CLICK_READY_SENTINEL
+
+APPS_DIR = Path(__file__).parent / "apps"
+
 # Path to your application executable
 APP_PATH = 'C:/Program Files/VideoLAN/VLC/vlc.exe'
 APP_NAME = "vlc"
+NODE_COUNT = 50
+
+# Upper bound for a single interaction before we give up on the child
+STEP_TIMEOUT = 300
+
+# How long an interactor may linger after its last click before it is stopped
+EXIT_GRACE = 10
+
+# Stream buffer limit so long rich table lines never overrun the reader
+PIPE_SIZE = 1 << 20
+READ_CHUNK = 64 * 1024
+
+# All workers click on the same desktop, so keep the fan-out small
+MAX_WORKERS = min(os.cpu_count() or 1, 4)
 
-from utils.fdom.config_manager import ConfigManager
-
-# Step 1: Create initial fDOM structure
-print("Step 1: Creating initial fDOM structure...")
-subprocess.run(["python", "-m", "utils.fdom.fdom_creator", APP_PATH])
-
-# Step 2: Use manual-click mode for automation
-print("Step 2: Starting manual click mode...")
-process = subprocess.Popen(
-    ["python", "-m", "utils.fdom.element_interactor", "--app-name", APP_NAME, "--manual-click"],
-    stdin=subprocess.PIPE,
-    stdout=subprocess.PIPE,
-    stderr=subprocess.PIPE,
-    text=True,
-    bufsize=1  # Line buffered
-)
-
-# Read and display output
-for i in range(50):
-    # Select node by index (starting with 0)
-    print(f"Selecting node {i}/50...")
-    process.stdin.write(f"{i}\n")
-    process.stdin.flush()
-    
-    # Wait for interaction to complete
-    time.sleep(5)
-    
-    # Read output
-    while True:
-        output = process.stdout.readline()
-        if not output.strip():
+
+async def follow_interactor_output(stdout: asyncio.StreamReader, indices: List[int], label: str = "",
+                                   echo: Callable[[str], None] = print,
+                                   on_click: Optional[Callable[[], None]] = None,
+                                   sentinel: str = MANUAL_CLICK_READY_SENTINEL,
+                                   timeout: float = STEP_TIMEOUT) -> int:
+    """Echo interactor output in bulk reads and return how many clicks completed"""
+    node_count = len(indices)
+    sentinels_seen = 0
+    partial = b""
+    # One sentinel for the initial listing, then one after every click
+    while sentinels_seen <= node_count:
+        try:
+            chunk = await asyncio.wait_for(stdout.read(READ_CHUNK), timeout)
+        except TimeoutError:
+            echo(f"No interactor output for {timeout}s, giving up")
+            break
+        if not chunk:
             break
-        print(output.strip())
 
-# Exit the process
-process.stdin.write("\n")
-process.stdin.flush()
+        *lines, partial = (partial + chunk).split(b"\n")
+        output = []
+        for raw in lines:
+            line = raw.decode(errors="replace").strip()
+            if line.startswith(sentinel):
+                # Every sentinel after the initial listing marks a finished click
+                if sentinels_seen and on_click:
+                    on_click()
+                sentinels_seen += 1
+            elif line:
+                output.append(f"[{label}] {line}" if label else line)
+        if output:
+            echo("\n".join(output))
+
+    return max(sentinels_seen - 1, 0)
+
+
+class AutoExplorer:
+    """
+    Scripted baseline exploration: build the initial fDOM, then feed node
+    indices to the interactor's manual-click mode
+    """
+
+    def __init__(self, app_path: str = APP_PATH, app_name: str = APP_NAME, node_count: int = NODE_COUNT,
+                 workers: int = 1):
+        self.app_path = app_path
+        self.app_name = app_name
+        self.node_count = node_count
+        self.workers = max(1, min(workers, MAX_WORKERS, node_count))
+
+        # Live progress bar while interactors run (set in run_manual_click_mode)
+        self._progress: Optional[Progress] = None
+        self._progress_task = None
+
+    def _fdom_cache_marker(self) -> Optional[Path]:
+        """Marker file keyed by the executable's size and mtime, None if the exe is missing"""
+        try:
+            stat = os.stat(self.app_path)
+        except OSError:
+            return None
+        return APPS_DIR / self.app_name / f".fdom_cache_{stat.st_size}_{int(stat.st_mtime)}.json"
+
+    def create_initial_fdom(self, force: bool = False) -> bool:
+        """Step 1: create the initial fDOM structure in-process, skipped if cached"""
+        marker = self._fdom_cache_marker()
+        fdom_file = APPS_DIR / self.app_name / "fdom.json"
+        if not force and marker and marker.exists() and fdom_file.exists():
+            print(f"Step 1: Reusing cached fDOM for unchanged {Path(self.app_path).name}")
+            return True
+
+        print("Step 1: Creating initial fDOM structure...")
+        # Imported here so importing this module (e.g. for APP_PATH) stays cheap
+        from utils.fdom.fdom_creator import FDOMCreator
+        result = FDOMCreator().create_fdom_for_app(self.app_path)
+        if not result.get("success", False):
+            print(f"fDOM creation failed: {result.get('error', 'Unknown error')}")
+            return False
+
+        if marker:
+            # Drop markers for older builds of the executable
+            for stale in marker.parent.glob(".fdom_cache_*.json"):
+                stale.unlink()
+            marker.write_text(json.dumps({"app_path": self.app_path, "created": datetime.now().isoformat()}))
+        return True
+
+    async def run_manual_click_mode(self) -> None:
+        """Step 2: drive the interactor's manual-click mode through the first N nodes"""
+        print(f"Step 2: Starting manual click mode ({self.workers} worker(s))...")
+
+        # Stride the indices so every shard gets a mix of early and late nodes
+        shards = [list(range(w, self.node_count, self.workers)) for w in range(self.workers)]
+        with Progress() as progress:
+            task = progress.add_task("Exploring nodes", total=self.node_count)
+            self._progress, self._progress_task = progress, task
+            results = await asyncio.gather(*(
+                self._run_interactor(indices, label=f"w{w}" if self.workers > 1 else "")
+                for w, indices in enumerate(shards)
+            ))
+        self._progress = None
+        print(f"Completed {sum(results)}/{self.node_count} clicks")
+
+    def _echo(self, text: str) -> None:
+        """Print child output above the progress bar without rich markup parsing"""
+        if self._progress is None:
+            print(text)
+        else:
+            self._progress.console.print(text, markup=False, highlight=False)
+
+    def _advance(self) -> None:
+        """Count one finished click on the progress bar"""
+        if self._progress is not None:
+            self._progress.update(self._progress_task, advance=1)
+
+    async def _run_interactor(self, indices: List[int], label: str = "") -> int:
+        """Run one manual-click interactor over the given node indices"""
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, "-m", "utils.fdom.element_interactor", "--app-name", self.app_name, "--manual-click",
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,  # Surface tracebacks inline, never fill an unread pipe
+            limit=PIPE_SIZE
+        )
+
+        # Queue every selection (plus the blank exit line) as raw bytes in one
+        # write; the interactor consumes them line by line at its own pace
+        selections = b"".join(b"%d\n" % i for i in indices) + b"\n"
+        process.stdin.write(selections)
+        await process.stdin.drain()
+        process.stdin.close()
+
+        completed = await follow_interactor_output(process.stdout, indices, label,
+                                                   echo=self._echo, on_click=self._advance)
+
+        await self._stop_interactor(process, f"Interactor {label}" if label else "Interactor")
+        return completed
+
+    async def _stop_interactor(self, process: asyncio.subprocess.Process, name: str) -> None:
+        """Give the interactor a grace period to exit, then terminate and finally kill it"""
+        for stop in (None, process.terminate, process.kill):
+            if process.returncode is not None:
+                break
+            if stop:
+                self._echo(f"{name} still running, sending {stop.__name__}()")
+                stop()
+            try:
+                await asyncio.wait_for(process.wait(), EXIT_GRACE)
+            except TimeoutError:
+                continue
+        self._echo(f"{name} finished with code {process.returncode}")
+
+    async def _run(self, rebuild_fdom: bool) -> bool:
+        # The interactor can't be pre-launched alongside fDOM creation: its
+        # startup launches the app and loads fdom.json, so it would race the
+        # creator for both. Creation also stays on this thread because the
+        # window/UIA layer is COM-initialized here.
+        if not self.create_initial_fdom(rebuild_fdom):
+            print("Aborting: manual click mode needs an initial fDOM")
+            return False
+        await self.run_manual_click_mode()
+        return True
+
+    def run(self, rebuild_fdom: bool = False) -> bool:
+        """Run both steps end to end, returning False if fDOM creation failed"""
+        if not asyncio.run(self._run(rebuild_fdom)):
+            return False
+        print(f"Auto-exploration complete! Check the fDOM results in apps/{self.app_name}/")
+        return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Baseline auto exploration via manual-click mode")
+    parser.add_argument("--app-path", default=APP_PATH, help=f"Path to application executable (default: {APP_PATH})")
+    parser.add_argument("--app-name", default=APP_NAME, help=f"App folder name under apps/ (default: {APP_NAME})")
+    parser.add_argument("--nodes", type=int, default=NODE_COUNT, help=f"Number of node indices to click (default: {NODE_COUNT})")
+    parser.add_argument("--workers", type=int, default=1,
+                        help=f"Parallel interactor processes, each with its own app instance (max {MAX_WORKERS}, default: 1)")
+    parser.add_argument("--rebuild-fdom", action="store_true", help="Recreate the initial fDOM even if the executable is unchanged")
+
+    args = parser.parse_args()
+
+    if not AutoExplorer(args.app_path, args.app_name, args.nodes, args.workers).run(rebuild_fdom=args.rebuild_fdom):
+        sys.exit(1)
+
 
-print("Auto-exploration complete! Check the fDOM results in apps/" + APP_NAME + "/")
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ Exploration Comparison Demo
 Demonstrates the differences between old shallow exploration vs new deep exploration
 """
 
+import os
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -14,161 +15,199 @@ from rich.table import Table
 from rich.columns import Columns
 from rich.text import Text
 
-def main():
-    console = Console()
-    
-    # Title
-    console.print(Panel(
-        "[bold blue]🔬 Exploration Methodology Comparison[/bold blue]\n\n"
-        "This demonstrates the differences between the old surface-level exploration\n"
-        "and the new comprehensive deep exploration approaches.",
-        title="📊 Analysis Comparison",
-        border_style="blue"
-    ))
-    
-    # Create comparison table
-    comparison_table = Table(show_header=True, header_style="bold magenta")
-    comparison_table.add_column("Aspect", style="cyan", width=20)
-    comparison_table.add_column("Old Approach\n(direct_explore.py)", style="yellow", width=35)
-    comparison_table.add_column("New Approach\n(deep_explore.py)", style="green", width=35)
-    
-    # Add comparison rows
-    comparison_table.add_row(
+# Plain-text rendering reused when stdout is redirected (CI logs, pipes)
+PLAIN_TEXT_CACHE = Path(__file__).with_suffix(".txt")
+
+# Below this width the usage panels are printed one after the other
+COLUMNS_MIN_WIDTH = 120
+
+# Static renderables are built once at import and reused by every render
+
+# Title
+_TITLE_PANEL = Panel(
+    "[bold blue]🔬 Exploration Methodology Comparison[/bold blue]\n\n"
+    "This demonstrates the differences between the old surface-level exploration\n"
+    "and the new comprehensive deep exploration approaches.",
+    title="📊 Analysis Comparison",
+    border_style="blue"
+)
+
+# Create comparison table
+_COMPARISON_TABLE = Table(show_header=True, header_style="bold magenta")
+_COMPARISON_TABLE.add_column("Aspect", style="cyan", width=20)
+_COMPARISON_TABLE.add_column("Old Approach\n(direct_explore.py)", style="yellow", width=35)
+_COMPARISON_TABLE.add_column("New Approach\n(deep_explore.py)", style="green", width=35)
+
+# Add comparison rows
+_COMPARISON_ROWS = (
+    (
         "Exploration Depth",
         "Surface level only\n• Only initial screen elements\n• No nested discovery",
         "Deep hierarchical exploration\n• Up to 10 levels deep\n• Discovers nested UI states\n• Follows interaction chains"
-    )
-    
-    comparison_table.add_row(
+    ),
+    (
         "Discovery Strategy",
         "Sequential iteration\n• Fixed 50-node limit\n• No state relationship tracking",
         "Intelligent graph traversal\n• Dynamic queue management\n• State relationship mapping\n• Backtracking support"
-    )
-    
-    comparison_table.add_row(
+    ),
+    (
         "State Management",
         "Basic state tracking\n• Simple click → result\n• No navigation memory",
         "Comprehensive state graphs\n• Parent-child relationships\n• Navigation path tracking\n• Smart backtracking"
-    )
-    
-    comparison_table.add_row(
+    ),
+    (
         "Coverage Analysis",
         "Basic success/failure counts\n• Simple statistics\n• No depth analysis",
         "Advanced coverage metrics\n• Depth distribution analysis\n• Functionality classification\n• Efficiency scoring"
-    )
-    
-    comparison_table.add_row(
+    ),
+    (
         "Automation Level",
         "Basic automation\n• Fixed iteration count\n• No adaptive behavior",
         "Intelligent automation\n• Dynamic exploration\n• Adaptive strategies\n• Performance optimization"
-    )
-    
-    comparison_table.add_row(
+    ),
+    (
         "Reporting",
         "Simple console output\n• Basic statistics\n• No detailed analysis",
         "Comprehensive reporting\n• Visual state hierarchy\n• Performance metrics\n• Actionable recommendations"
-    )
-    
-    comparison_table.add_row(
+    ),
+    (
         "Application Types",
         "Simple applications only\n• Limited to basic UIs\n• Poor with complex apps",
         "Any complexity level\n• Handles complex UIs\n• Discovers hidden features\n• Explores dialog systems"
-    )
-    
-    console.print(comparison_table)
-    
-    # Usage examples
-    console.print("\n")
-    
-    old_usage = Panel(
-        "[yellow]# Old approach - Basic exploration[/yellow]\n"
-        "python direct_explore.py\n"
-        "python auto_explore.py\n\n"
-        "[dim]• Fixed 50 iterations\n"
-        "• Surface-level only\n"
-        "• Basic reporting[/dim]",
-        title="📁 Old Usage",
-        border_style="yellow"
-    )
-    
-    new_usage = Panel(
-        "[green]# New approach - Deep exploration[/green]\n"
-        "python deep_explore.py\n"
-        "python enhanced_auto_explore.py app.exe\n"
-        "python enhanced_auto_explore.py app.exe --runtime 120 --max-depth 10\n\n"
-        "[dim]• Configurable depth & runtime\n"
-        "• Comprehensive coverage\n"
-        "• Advanced analytics[/dim]",
-        title="🚀 New Usage",
-        border_style="green"
-    )
-    
-    console.print(Columns([old_usage, new_usage]))
-    
-    # Performance expectations
-    console.print("\n")
-    performance_panel = Panel(
-        "[bold]Expected Performance Improvements:[/bold]\n\n"
-        "🎯 [green]Coverage:[/green] 10-50x more comprehensive\n"
-        "🔍 [green]Discovery:[/green] Finds hidden features and nested functionality\n"
-        "📊 [green]Analysis:[/green] Detailed metrics and insights\n"
-        "🤖 [green]Intelligence:[/green] Adaptive exploration strategies\n"
-        "⏱️ [green]Efficiency:[/green] Smart navigation and backtracking\n"
-        "📋 [green]Reporting:[/green] Actionable insights and recommendations",
-        title="📈 Performance Improvements",
-        border_style="green"
-    )
-    
-    console.print(performance_panel)
-    
-    # Specific use cases
-    console.print("\n")
-    use_cases_table = Table(show_header=True, header_style="bold cyan")
-    use_cases_table.add_column("Application Type", style="cyan", width=20)
-    use_cases_table.add_column("Old Approach Result", style="yellow", width=35)
-    use_cases_table.add_column("New Approach Result", style="green", width=35)
-    
-    use_cases_table.add_row(
+    ),
+)
+
+for row in _COMPARISON_ROWS:
+    _COMPARISON_TABLE.add_row(*row)
+
+# Usage examples
+_OLD_USAGE = Panel(
+    "[yellow]# Old approach - Basic exploration[/yellow]\n"
+    "python direct_explore.py\n"
+    "python auto_explore.py\n\n"
+    "[dim]• Fixed 50 iterations\n"
+    "• Surface-level only\n"
+    "• Basic reporting[/dim]",
+    title="📁 Old Usage",
+    border_style="yellow"
+)
+
+_NEW_USAGE = Panel(
+    "[green]# New approach - Deep exploration[/green]\n"
+    "python deep_explore.py\n"
+    "python enhanced_auto_explore.py app.exe\n"
+    "python enhanced_auto_explore.py app.exe --runtime 120 --max-depth 10\n\n"
+    "[dim]• Configurable depth & runtime\n"
+    "• Comprehensive coverage\n"
+    "• Advanced analytics[/dim]",
+    title="🚀 New Usage",
+    border_style="green"
+)
+
+_USAGE_COLUMNS = Columns([_OLD_USAGE, _NEW_USAGE])
+
+# Performance expectations
+_PERFORMANCE_PANEL = Panel(
+    "[bold]Expected Performance Improvements:[/bold]\n\n"
+    "🎯 [green]Coverage:[/green] 10-50x more comprehensive\n"
+    "🔍 [green]Discovery:[/green] Finds hidden features and nested functionality\n"
+    "📊 [green]Analysis:[/green] Detailed metrics and insights\n"
+    "🤖 [green]Intelligence:[/green] Adaptive exploration strategies\n"
+    "⏱️ [green]Efficiency:[/green] Smart navigation and backtracking\n"
+    "📋 [green]Reporting:[/green] Actionable insights and recommendations",
+    title="📈 Performance Improvements",
+    border_style="green"
+)
+
+# Specific use cases
+_USECASES_TABLE = Table(show_header=True, header_style="bold cyan")
+_USECASES_TABLE.add_column("Application Type", style="cyan", width=20)
+_USECASES_TABLE.add_column("Old Approach Result", style="yellow", width=35)
+_USECASES_TABLE.add_column("New Approach Result", style="green", width=35)
+
+_USECASES_ROWS = (
+    (
         "Simple Text Editor",
         "• Finds main menu items\n• Misses dialog boxes\n• Limited to visible buttons",
         "• Discovers all dialogs\n• Maps entire menu system\n• Finds hidden shortcuts\n• Explores preferences deeply"
-    )
-    
-    use_cases_table.add_row(
+    ),
+    (
         "Complex IDE",
         "• Only surface elements\n• Misses 90% of features\n• No plugin discovery",
         "• Maps entire feature set\n• Discovers plugin interfaces\n• Explores all tool windows\n• Finds configuration depths"
-    )
-    
-    use_cases_table.add_row(
+    ),
+    (
         "Media Player",
         "• Basic play/pause buttons\n• Misses advanced features\n• No settings exploration",
         "• Discovers all media formats\n• Maps audio/video settings\n• Finds advanced features\n• Explores equalizer/effects"
-    )
-    
-    use_cases_table.add_row(
+    ),
+    (
         "Office Application",
         "• Surface toolbar only\n• Misses ribbon complexity\n• No advanced features",
         "• Maps entire ribbon system\n• Discovers all dialog trees\n• Finds advanced formatting\n• Explores macro capabilities"
-    )
+    ),
+)
+
+for row in _USECASES_ROWS:
+    _USECASES_TABLE.add_row(*row)
+
+# Recommendations
+_RECS_PANEL = Panel(
+    "[bold blue]🎯 Migration Recommendations:[/bold blue]\n\n"
+    "[green]✅ For New Projects:[/green] Use `deep_explore.py` or `enhanced_auto_explore.py`\n"
+    "[green]✅ For Comprehensive Analysis:[/green] Use the new automated system with 60+ minute runtime\n"
+    "[green]✅ For Complex Applications:[/green] Increase max-depth to 8-10 levels\n"
+    "[green]✅ For Quick Assessment:[/green] Use enhanced_auto_explore.py with --runtime 15\n\n"
+    "[yellow]⚠️ Legacy Scripts:[/yellow] Keep old scripts only for simple baseline comparisons\n"
+    "[red]❌ Deprecated:[/red] Avoid direct_explore.py and auto_explore.py for production analysis",
+    title="📋 Usage Recommendations",
+    border_style="blue"
+)
+
+
+def main():
+    console = Console()
     
-    console.print(use_cases_table)
+    if not console.is_terminal:
+        print_plain_comparison()
+        return
     
-    # Recommendations
+    render_comparison(console)
+
+def print_plain_comparison():
+    """Print the cached plain-text comparison, rendering it once if stale"""
+    script_path = Path(__file__)
+    if not PLAIN_TEXT_CACHE.exists() or PLAIN_TEXT_CACHE.stat().st_mtime < script_path.stat().st_mtime:
+        with open(os.devnull, "w", encoding="utf-8") as sink:
+            recorder = Console(record=True, file=sink, width=120, color_system=None)
+            render_comparison(recorder)
+        text = recorder.export_text()
+        try:
+            PLAIN_TEXT_CACHE.write_text(text, encoding="utf-8")
+        except OSError:
+            pass  # Read-only install: just print without caching
+        sys.stdout.write(text)
+        return
+    
+    sys.stdout.write(PLAIN_TEXT_CACHE.read_text(encoding="utf-8"))
+
+def render_comparison(console: Console):
+    """Render all comparison panels and tables to the given console"""
+    console.print(_TITLE_PANEL)
+    console.print(_COMPARISON_TABLE)
     console.print("\n")
-    recommendations_panel = Panel(
-        "[bold blue]🎯 Migration Recommendations:[/bold blue]\n\n"
-        "[green]✅ For New Projects:[/green] Use `deep_explore.py` or `enhanced_auto_explore.py`\n"
-        "[green]✅ For Comprehensive Analysis:[/green] Use the new automated system with 60+ minute runtime\n"
-        "[green]✅ For Complex Applications:[/green] Increase max-depth to 8-10 levels\n"
-        "[green]✅ For Quick Assessment:[/green] Use enhanced_auto_explore.py with --runtime 15\n\n"
-        "[yellow]⚠️ Legacy Scripts:[/yellow] Keep old scripts only for simple baseline comparisons\n"
-        "[red]❌ Deprecated:[/red] Avoid direct_explore.py and auto_explore.py for production analysis",
-        title="📋 Usage Recommendations",
-        border_style="blue"
-    )
-    
-    console.print(recommendations_panel)
+    # Narrow terminals would stack the columns anyway; skip the measuring pass
+    if console.size.width < COLUMNS_MIN_WIDTH:
+        console.print(_OLD_USAGE)
+        console.print(_NEW_USAGE)
+    else:
+        console.print(_USAGE_COLUMNS)
+    console.print("\n")
+    console.print(_PERFORMANCE_PANEL)
+    console.print("\n")
+    console.print(_USECASES_TABLE)
+    console.print("\n")
+    console.print(_RECS_PANEL)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
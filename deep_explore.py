@@ -9,11 +9,18 @@ import os
 import sys
 import time
 import json
+import re
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Callable, Dict, List, Set, Optional, Tuple
 from datetime import datetime
 from dataclasses import dataclass
-from collections import defaultdict
+from collections import Counter, defaultdict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Reports fall back to the stdlib json encoder
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -31,7 +38,36 @@ from utils.fdom.fdom_creator import FDOMCreator
 from utils.fdom.state_manager import StateManager
 from utils.fdom.config_manager import ConfigManager
 
-@dataclass
+# Single writer keeps report files off the exploration thread and in submit order
+_REPORT_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-writer")
+
+# Counters kept as DeepExplorer attributes and reported under "stats"
+STAT_FIELDS = (
+    'total_states_discovered', 'total_elements_discovered', 'total_interactions',
+    'successful_interactions', 'failed_interactions', 'dialogs_discovered', 'menus_discovered',
+    'deadends_found', 'max_depth_reached', 'focus_failures', 'focus_recoveries',
+    'exploration_start_time', 'exploration_end_time'
+)
+
+# Per-app file (next to fdom.json) carrying explorer-only knowledge between runs
+EXPLORER_CACHE_FILE = "explorer_cache.json"
+
+# Depth value marking a "return to this state" entry on the exploration stack
+BACKTRACK_MARKER = -1
+
+# Element (name, type) signatures that failed or did nothing this many times are skipped
+DEAD_SIGNATURE_THRESHOLD = 3
+
+# Seconds to let the UI settle after a state transition before the next click
+QUIESCENCE_CAP = 1.0
+
+# Trigger-name keywords used to classify newly discovered states
+_DIALOG_KWS = ("dialog", "popup", "modal", "alert", "confirm")
+_MENU_KWS = ("menu", "dropdown", "submenu", "context")
+_DIALOG_RE = re.compile("|".join(_DIALOG_KWS))
+_MENU_RE = re.compile("|".join(_MENU_KWS))
+
+@dataclass(slots=True)
 class ExplorationStrategy:
     """Configuration for exploration strategy"""
     max_depth: int = 10                    # Maximum exploration depth
@@ -45,15 +81,17 @@ class ExplorationStrategy:
     safety_timeouts: bool = True           # Whether to use safety timeouts
     state_timeout: int = 30                # Timeout per state exploration (seconds)
     total_timeout: int = 7200             # Total exploration timeout (2 hours)
+    verbose: bool = False                  # Whether to log every element tested, not just outcomes
+    warm_start: bool = True                # Whether to reuse classifications/dead ends from earlier runs
 
-@dataclass
+@dataclass(slots=True)
 class ExplorationState:
     """Represents a discovered application state during exploration"""
     state_id: str
     depth: int
     parent_state: Optional[str]
     trigger_element: Optional[str]
-    discovered_at: datetime
+    discovered_at: float                  # Epoch seconds; converted to ISO only for reports
     element_count: int
     explored: bool = False
     is_deadend: bool = False
@@ -74,24 +112,50 @@ class DeepExplorer:
         self.discovered_states: Dict[str, ExplorationState] = {}
         self.exploration_graph: Dict[str, List[str]] = defaultdict(list)  # state -> child states
         self.backtrack_stack: List[Tuple[str, str]] = []  # [(state_id, element_id)]
-        self.exploration_queue: List[Tuple[str, int]] = []  # [(state_id, depth)]
-        
-        # Statistics tracking
-        self.stats = {
-            'total_states_discovered': 0,
-            'total_elements_discovered': 0,
-            'total_interactions': 0,
-            'successful_interactions': 0,
-            'failed_interactions': 0,
-            'dialogs_discovered': 0,
-            'menus_discovered': 0,
-            'deadends_found': 0,
-            'max_depth_reached': 0,
-            'focus_failures': 0,
-            'focus_recoveries': 0,
-            'exploration_start_time': None,
-            'exploration_end_time': None
-        }
+        self.exploration_stack: deque[Tuple[str, int]] = deque()  # LIFO [(state_id, depth)]
+        
+        # Node lookups are dropped when a new state lands in the fDOM; the
+        # pending-node buckets are extended with that state instead
+        self._node_lookup_cache: Dict[str, Optional[Dict]] = {}
+        self._pending_by_state: Optional[Dict[str, List[str]]] = None
+        
+        # Per-element log lines, flushed in one print when a state is finished
+        self._log_buffer: List[str] = []
+        
+        # (name, type) signatures of elements that keep failing or changing nothing
+        self._dead_signatures: Counter[Tuple[str, str]] = Counter()
+        
+        # Pending nodes passed over for a dead signature this run; they stay pending in fdom.json
+        self._skipped_elements: Set[str] = set()
+        
+        # Running count of discovered states at each depth (like the dialog/menu/
+        # dead-end counters, kept in step with the state flags so reports needn't rescan)
+        self._states_per_depth: Counter[int] = Counter()
+        
+        # Monotonic clock reading at start, used for cheap time-limit checks
+        self._start_monotonic: Optional[float] = None
+        
+        # Optional callback(state_id, record) fired once per state as it is discovered,
+        # e.g. to stream states to disk during long runs
+        self.on_state_added: Optional[Callable[[str, Dict], None]] = None
+        
+        # apps/<app_name> output directory, resolved once the app is initialized
+        self._apps_dir: Optional[Path] = None
+        
+        # Statistics tracking (plain attributes; the `stats` property builds the dict view)
+        self.total_states_discovered = 0
+        self.total_elements_discovered = 0
+        self.total_interactions = 0
+        self.successful_interactions = 0
+        self.failed_interactions = 0
+        self.dialogs_discovered = 0
+        self.menus_discovered = 0
+        self.deadends_found = 0
+        self.max_depth_reached = 0
+        self.focus_failures = 0
+        self.focus_recoveries = 0
+        self.exploration_start_time: Optional[datetime] = None
+        self.exploration_end_time: Optional[datetime] = None
         
         # Initialize FDOM framework
         self.console.print(Panel(
@@ -109,11 +173,17 @@ class DeepExplorer:
         self.element_interactor = None
         self.state_manager = None
         
+    @property
+    def stats(self) -> Dict:
+        """Snapshot of the exploration counters as a dict"""
+        return {name: getattr(self, name) for name in STAT_FIELDS}
+    
     def run_deep_exploration(self) -> Dict:
         """
         Execute comprehensive deep exploration of the application
         """
-        self.stats['exploration_start_time'] = datetime.now()
+        self.exploration_start_time = datetime.now()
+        self._start_monotonic = time.monotonic()
         
         try:
             # Phase 1: Initialize application and FDOM
@@ -141,7 +211,7 @@ class DeepExplorer:
             self.console.print(f"\n[red]❌ Exploration failed: {e}[/red]")
             return self._create_failure_result(str(e))
         finally:
-            self.stats['exploration_end_time'] = datetime.now()
+            self.exploration_end_time = datetime.now()
     
     def _initialize_application(self) -> bool:
         """Initialize the application and FDOM framework"""
@@ -186,6 +256,9 @@ class DeepExplorer:
                 self.console.print("[red]❌ Failed to get required components from FDOM creator[/red]")
                 return False
             
+            # Reports (and any future checkpoints) land next to the app's fdom.json
+            self._apps_dir = self._resolve_apps_dir()
+            
             app_name = getattr(self.fdom_creator, 'current_app_name', 'unknown_app')
             self.console.print(f"[green]✅ Application initialized: {app_name}[/green]")
             return True
@@ -214,55 +287,142 @@ class DeepExplorer:
                 depth=0,
                 parent_state=None,
                 trigger_element=None,
-                discovered_at=datetime.now(),
+                discovered_at=time.time(),
                 element_count=element_count
             )
             
             self.discovered_states[current_state_id] = initial_state
-            self.exploration_queue.append((current_state_id, 0))
+            self._states_per_depth[0] += 1
+            self.exploration_stack.append((current_state_id, 0))
             
-            self.stats['total_states_discovered'] = 1
-            self.stats['total_elements_discovered'] = element_count
+            self.total_states_discovered = 1
+            self.total_elements_discovered = element_count
             
             self.console.print(f"[green]✅ Initial state discovered: {current_state_id} ({element_count} elements)[/green]")
+            
+            # Resume from states a previous session already put in the fDOM
+            self._seed_from_existing_fdom(current_state_id)
+            if self.strategy.warm_start:
+                self._load_explorer_cache()
+            
+            for state_id in self.discovered_states:
+                self._notify_state_added(state_id)
             return True
             
         except Exception as e:
             self.console.print(f"[red]❌ Initial state discovery error: {e}[/red]")
             return False
     
+    def _seed_from_existing_fdom(self, initial_state_id: str) -> None:
+        """
+        Register states persisted by earlier sessions in one pass over the fDOM edges
+        
+        States with no pending elements are recorded as already explored; the rest
+        are pushed onto the stack so exploration picks up where it left off.
+        """
+        
+        states = self.state_manager.fdom_data.get("states", {})
+        children = defaultdict(list)
+        for edge in self.state_manager.fdom_data.get("edges", []):
+            from_state, to_state = edge.get("from"), edge.get("to")
+            if from_state in states and to_state in states:
+                children[from_state].append(edge)
+        
+        # Breadth-first over recorded edges gives each state its shallowest depth
+        frontier = deque([(initial_state_id, 0)])
+        while frontier:
+            parent_id, parent_depth = frontier.popleft()
+            for edge in children.get(parent_id, []):
+                state_id = edge["to"]
+                if state_id in self.discovered_states:
+                    continue
+                
+                action = edge.get("action", "")
+                trigger_element = f"{parent_id}::{action[len('click:'):]}" if action.startswith("click:") else None
+                element_count = len(states[state_id].get("nodes", {}))
+                has_pending = bool(self._get_pending_elements_for_state(state_id))
+                
+                self.discovered_states[state_id] = ExplorationState(
+                    state_id=state_id,
+                    depth=parent_depth + 1,
+                    parent_state=parent_id,
+                    trigger_element=trigger_element,
+                    discovered_at=time.time(),
+                    element_count=element_count,
+                    explored=not has_pending
+                )
+                self.exploration_graph[parent_id].append(state_id)
+                self._states_per_depth[parent_depth + 1] += 1
+                self.total_states_discovered += 1
+                self.total_elements_discovered += element_count
+                
+                if has_pending and parent_depth + 1 <= self.strategy.max_depth:
+                    self.exploration_stack.append((state_id, parent_depth + 1))
+                frontier.append((state_id, parent_depth + 1))
+        
+        resumed = len(self.discovered_states) - 1
+        if resumed:
+            self.console.print(f"[green]♻️ Resumed {resumed} states from existing fDOM ({len(self.exploration_stack) - 1} with pending elements)[/green]")
+    
     def _execute_deep_exploration(self) -> None:
         """Execute the main deep exploration loop"""
         
+        # One live line (redrawn at 4Hz) carries the running counters instead of
+        # separate status prints for every state
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
+            TextColumn("[dim]🌍 {task.fields[states]} states · 🖱️ {task.fields[interactions]} clicks · ⛔ {task.fields[deadends]} dead ends[/dim]"),
             TimeElapsedColumn(),
-            console=self.console
+            console=self.console,
+            refresh_per_second=4
         ) as progress:
             
-            task = progress.add_task("🔍 Deep exploration in progress...", total=None)
+            task = progress.add_task("🔍 Deep exploration in progress...", total=None,
+                                     states=self.total_states_discovered, interactions=0, deadends=0)
             
-            while (self.exploration_queue and 
-                   self.stats['total_states_discovered'] < self.strategy.max_total_states and
-                   self._check_time_limit()):
+            stack = self.exploration_stack
+            max_total_states = self.strategy.max_total_states
+            max_depth = self.strategy.max_depth
+            
+            while stack and self.total_states_discovered < max_total_states:
+                # Depth-first: take the most recently discovered state
+                current_state_id, depth = stack.pop()
                 
-                # Get next state to explore
-                current_state_id, depth = self.exploration_queue.pop(0)
+                if depth == BACKTRACK_MARKER:
+                    # A subtree is finished - step back to its parent exactly once,
+                    # unless that parent's whole subtree turned out to be dead
+                    if (self.element_interactor.current_state_id != current_state_id and
+                            not self.discovered_states[current_state_id].is_deadend):
+                        self._navigate_to_state(current_state_id)
+                    continue
                 
-                if depth > self.strategy.max_depth:
+                if depth > max_depth or self.discovered_states[current_state_id].is_deadend:
                     continue
                 
+                # Backtracks and skipped states are cheap, so the clock is only read before exploring one
+                if not self._check_time_limit():
+                    break
+                
+                # Queue the return to our parent underneath any children we discover
+                parent_state = self.discovered_states[current_state_id].parent_state
+                if parent_state:
+                    stack.append((parent_state, BACKTRACK_MARKER))
+                
                 # Update progress
-                progress.update(task, description=f"🔍 Exploring {current_state_id} (depth {depth})")
+                progress.update(task, description=f"🔍 Exploring {current_state_id} (depth {depth})",
+                                states=self.total_states_discovered, interactions=self.total_interactions,
+                                deadends=self.deadends_found)
                 
                 # Explore current state
                 self._explore_state_comprehensively(current_state_id, depth)
                 
                 # Update statistics
-                self.stats['max_depth_reached'] = max(self.stats['max_depth_reached'], depth)
+                self.max_depth_reached = max(self.max_depth_reached, depth)
             
-            progress.update(task, description="✅ Deep exploration completed")
+            progress.update(task, description="✅ Deep exploration completed",
+                            states=self.total_states_discovered, interactions=self.total_interactions,
+                            deadends=self.deadends_found)
     
     def _explore_state_comprehensively(self, state_id: str, depth: int) -> None:
         """Comprehensively explore a single state to discover all possible interactions"""
@@ -286,57 +446,86 @@ class DeepExplorer:
             self.console.print(f"[yellow]📍 No pending elements in {state_id} - marking as deadend[/yellow]")
             if state_id in self.discovered_states:
                 self.discovered_states[state_id].is_deadend = True
-                self.stats['deadends_found'] += 1
+                self.deadends_found += 1
+                self._propagate_deadend(state_id)
             return
         
-        self.console.print(f"[cyan]📋 Found {len(pending_elements)} elements to explore[/cyan]")
+        self._log(f"[cyan]📋 Found {len(pending_elements)} elements to explore[/cyan]")
         
-        # Explore each element strategically
-        for element_id in pending_elements:
-            if not self._check_time_limit():
-                break
+        # Explore each element strategically (bound methods hoisted out of the loop)
+        check_time_limit = self._check_time_limit
+        explore_element = self._explore_element_strategically
+        wait_for_idle = self.element_interactor.wait_for_idle
+        try:
+            for element_id in pending_elements:
+                if not check_time_limit():
+                    break
+                    
+                state_changed = explore_element(element_id, state_id, depth)
                 
-            self._explore_element_strategically(element_id, state_id, depth)
-            
-            # Small delay between interactions for stability
-            time.sleep(1)
+                # Only a state transition (and its backtrack) can leave the UI settling
+                if state_changed:
+                    wait_for_idle(QUIESCENCE_CAP)
+        finally:
+            self._flush_log()
     
-    def _explore_element_strategically(self, element_id: str, current_state_id: str, depth: int) -> None:
-        """Strategically explore a single element with comprehensive interaction discovery"""
+    def _explore_element_strategically(self, element_id: str, current_state_id: str, depth: int) -> bool:
+        """
+        Strategically explore a single element with comprehensive interaction discovery
+        
+        Returns True if the interaction may have moved the UI (state change or error)
+        """
         
-        element_data = self.element_interactor._find_node_in_fdom(element_id)
+        log = self._log
+        
+        element_data = self._find_node(element_id)
         if not element_data:
-            return
+            return False
         
         element_name = element_data.get('g_icon_name', 'unknown')
         element_type = element_data.get('g_type', 'unknown')
+        signature = (element_name, element_type)
+        
+        # Same widget already wasted several clicks elsewhere (e.g. separators) - skip it
+        if self._dead_signatures[signature] >= DEAD_SIGNATURE_THRESHOLD:
+            log(f"[dim]  ⏭️ Skipping known dead end: {element_name} ({element_type})[/dim]", verbose_only=True)
+            # Never clicked, so not explored: only hide it from this run's pending lists
+            self._skipped_elements.add(element_id)
+            return False
         
-        self.console.print(f"[blue]  🔍 Testing: {element_name} ({element_type})[/blue]")
+        log(f"[blue]  🔍 Testing: {element_name} ({element_type})[/blue]", verbose_only=True)
         
         # Track interaction attempt
-        self.stats['total_interactions'] += 1
+        self.total_interactions += 1
         
         try:
             # Primary interaction: Left click
             result = self.element_interactor.click_element(element_id)
+            state_changed = result.state_changed
             
             if result.success:
-                self.stats['successful_interactions'] += 1
+                self.successful_interactions += 1
                 
-                if result.state_changed:
+                if state_changed:
                     # New state discovered!
                     new_state_id = result.new_state_id
-                    self._register_new_state(new_state_id, current_state_id, element_id, depth + 1)
+                    is_new = self._register_new_state(new_state_id, current_state_id, element_id, depth + 1)
                     
                     # Check if this is a dialog or menu
                     self._classify_new_state(new_state_id, element_name, element_type)
+                    if is_new:
+                        self._notify_state_added(new_state_id)
                     
-                    self.console.print(f"[green]    ✅ New state discovered: {new_state_id}[/green]")
+                    log(f"[green]    ✅ New state discovered: {new_state_id}[/green]")
                 else:
-                    self.console.print(f"[yellow]    ⚪ Non-interactive element: {element_name}[/yellow]")
+                    log(f"[yellow]    ⚪ Non-interactive element: {element_name}[/yellow]", verbose_only=True)
             else:
-                self.stats['failed_interactions'] += 1
-                self.console.print(f"[red]    ❌ Interaction failed: {result.error_message}[/red]")
+                self.failed_interactions += 1
+                log(f"[red]    ❌ Interaction failed: {result.error_message}[/red]")
+            
+            # Uncaptioned elements share a placeholder name, so they can't form a signature
+            if not (result.success and state_changed) and element_name not in ('unknown', 'unanalyzed'):
+                self._dead_signatures[signature] += 1
             
             # Monitor focus status after each interaction
             self._monitor_focus_status()
@@ -344,26 +533,29 @@ class DeepExplorer:
             # Secondary interaction: Right click for context menus (if enabled)
             if (self.strategy.explore_context_menus and 
                 element_type in ['icon', 'button'] and 
-                not result.state_changed):
+                not state_changed):
                 
                 self._try_context_menu_interaction(element_id, current_state_id, depth)
+            
+            return bool(state_changed)
                 
         except Exception as e:
-            self.stats['failed_interactions'] += 1
-            self.console.print(f"[red]    ❌ Exception during interaction: {e}[/red]")
+            self.failed_interactions += 1
+            log(f"[red]    ❌ Exception during interaction: {e}[/red]")
+            return True
     
     def _try_context_menu_interaction(self, element_id: str, current_state_id: str, depth: int) -> None:
         """Try right-click interaction to discover context menus"""
         
         # Note: This would require extending the element_interactor to support right-click
         # For now, we'll log the attempt
-        self.console.print(f"[dim]    🖱️ Context menu check: {element_id} (feature pending)[/dim]")
+        self._log(f"[dim]    🖱️ Context menu check: {element_id} (feature pending)[/dim]", verbose_only=True)
     
-    def _register_new_state(self, state_id: str, parent_state_id: str, trigger_element: str, depth: int) -> None:
-        """Register a newly discovered state"""
+    def _register_new_state(self, state_id: str, parent_state_id: str, trigger_element: str, depth: int) -> bool:
+        """Register a newly discovered state, returning False if it was already known"""
         
         if state_id in self.discovered_states:
-            return  # Already discovered
+            return False  # Already discovered
         
         # Get element count for the new state
         fdom_data = self.state_manager.fdom_data
@@ -377,23 +569,76 @@ class DeepExplorer:
             depth=depth,
             parent_state=parent_state_id,
             trigger_element=trigger_element,
-            discovered_at=datetime.now(),
+            discovered_at=time.time(),
             element_count=element_count
         )
         
         self.discovered_states[state_id] = new_state
+        self._states_per_depth[depth] += 1
+        self._node_lookup_cache.clear()
+        self._bucket_pending_for_state(state_id)
         
         # Add to exploration graph
         self.exploration_graph[parent_state_id].append(state_id)
         
+        # Update statistics
+        self.total_states_discovered += 1
+        self.total_elements_discovered += element_count
+        
+        # Nothing to click here - record the dead end now instead of navigating to it later
+        if not self._get_pending_elements_for_state(state_id):
+            new_state.explored = True
+            new_state.is_deadend = True
+            self.deadends_found += 1
+            self._propagate_deadend(state_id)
+            return True
+        
         # Add to exploration queue if within limits
         if (depth <= self.strategy.max_depth and 
-            len([s for s in self.discovered_states.values() if s.depth == depth]) < self.strategy.max_states_per_level):
-            self.exploration_queue.append((state_id, depth))
+            self._states_per_depth[depth] < self.strategy.max_states_per_level):
+            self.exploration_stack.append((state_id, depth))
+        return True
+    
+    def _notify_state_added(self, state_id: str) -> None:
+        """Hand a newly registered (and classified) state to the on_state_added hook"""
         
-        # Update statistics
-        self.stats['total_states_discovered'] += 1
-        self.stats['total_elements_discovered'] += element_count
+        if self.on_state_added is None:
+            return
+        try:
+            self.on_state_added(state_id, self._state_record(self.discovered_states[state_id]))
+        except Exception as e:
+            self.console.print(f"[dim yellow]⚠️ on_state_added hook failed: {e}[/dim]")
+    
+    @staticmethod
+    def _state_record(state: ExplorationState) -> Dict:
+        """Report/stream representation of a discovered state"""
+        
+        return {
+            "depth": state.depth,
+            "parent_state": state.parent_state,
+            "trigger_element": state.trigger_element,
+            "element_count": state.element_count,
+            "explored": state.explored,
+            "is_deadend": state.is_deadend,
+            "is_dialog": state.is_dialog,
+            "is_menu": state.is_menu,
+            "discovered_at": datetime.fromtimestamp(state.discovered_at).isoformat()
+        }
+    
+    def _propagate_deadend(self, state_id: str) -> None:
+        """Poison ancestors whose own elements are done and whose children are all dead ends"""
+        
+        parent_id = self.discovered_states[state_id].parent_state
+        while parent_id in self.discovered_states:
+            parent = self.discovered_states[parent_id]
+            if parent.is_deadend or not parent.explored or self._get_pending_elements_for_state(parent_id):
+                return
+            children = self.exploration_graph.get(parent_id, [])
+            if not all(self.discovered_states[child].is_deadend for child in children if child in self.discovered_states):
+                return
+            parent.is_deadend = True
+            self.deadends_found += 1
+            parent_id = parent.parent_state
     
     def _classify_new_state(self, state_id: str, trigger_element_name: str, trigger_element_type: str) -> None:
         """Classify the type of newly discovered state"""
@@ -402,78 +647,169 @@ class DeepExplorer:
             return
         
         state = self.discovered_states[state_id]
+        if state.is_dialog or state.is_menu:
+            return  # Reached again via another element; already counted
         
         # Simple heuristics for classification
         trigger_name_lower = trigger_element_name.lower()
         
-        if any(keyword in trigger_name_lower for keyword in ['dialog', 'popup', 'modal', 'alert', 'confirm']):
+        if _DIALOG_RE.search(trigger_name_lower):
             state.is_dialog = True
-            self.stats['dialogs_discovered'] += 1
-            self.console.print(f"[magenta]    📄 Dialog detected: {state_id}[/magenta]")
+            self.dialogs_discovered += 1
+            self._log(f"[magenta]    📄 Dialog detected: {state_id}[/magenta]")
             
-        elif any(keyword in trigger_name_lower for keyword in ['menu', 'dropdown', 'submenu', 'context']):
+        elif _MENU_RE.search(trigger_name_lower):
             state.is_menu = True
-            self.stats['menus_discovered'] += 1
-            self.console.print(f"[cyan]    📋 Menu detected: {state_id}[/cyan]")
+            self.menus_discovered += 1
+            self._log(f"[cyan]    📋 Menu detected: {state_id}[/cyan]")
     
     def _get_pending_elements_for_state(self, state_id: str) -> List[str]:
         """Get all pending elements for a specific state"""
         
-        pending_elements = []
+        pending_nodes = self.state_manager.pending_nodes
         
-        for pending_node_id in self.state_manager.pending_nodes:
-            if pending_node_id.startswith(f"{state_id}::"):
-                pending_elements.append(pending_node_id)
+        # Bucket every pending node by state in one pass, reused until a new state appears
+        if self._pending_by_state is None:
+            self._pending_by_state = defaultdict(list)
+            for pending_node_id in pending_nodes:
+                node_state, sep, _ = pending_node_id.partition("::")
+                if sep:
+                    self._pending_by_state[node_state].append(pending_node_id)
         
-        return pending_elements
+        # Nodes explored or skipped since the bucket was built are filtered out here
+        skipped = self._skipped_elements
+        return [node_id for node_id in self._pending_by_state.get(state_id, ())
+                if node_id in pending_nodes and node_id not in skipped]
+    
+    def _find_node(self, element_id: str) -> Optional[Dict]:
+        """Memoized element_interactor._find_node_in_fdom"""
+        
+        if element_id not in self._node_lookup_cache:
+            self._node_lookup_cache[element_id] = self.element_interactor._find_node_in_fdom(element_id)
+        return self._node_lookup_cache[element_id]
+    
+    def _bucket_pending_for_state(self, state_id: str) -> None:
+        """Add a newly created state's pending nodes to the bucket without a full rescan"""
+        
+        if self._pending_by_state is None:
+            return  # Built lazily on first lookup, which will include this state
+        
+        pending_nodes = self.state_manager.pending_nodes
+        nodes = self.state_manager.fdom_data.get("states", {}).get(state_id, {}).get("nodes", {})
+        prefix = state_id + "::"
+        self._pending_by_state[state_id] = [prefix + node_id for node_id in nodes if prefix + node_id in pending_nodes]
+    
+    def _log(self, message: str, verbose_only: bool = False) -> None:
+        """Buffer a per-element log line (verbose-only lines are dropped unless strategy.verbose)"""
+        
+        if verbose_only and not self.strategy.verbose:
+            return
+        self._log_buffer.append(message)
+    
+    def _flush_log(self) -> None:
+        """Print all buffered per-element lines in a single console write"""
+        
+        if self._log_buffer:
+            self.console.print("\n".join(self._log_buffer))
+            self._log_buffer.clear()
     
     def _navigate_to_state(self, target_state_id: str) -> bool:
         """Navigate to a specific state using the exploration graph"""
         
-        if self.element_interactor.current_state_id == target_state_id:
+        current_state_id = self.element_interactor.current_state_id
+        if current_state_id == target_state_id:
             return True
         
-        # Try using the element_interactor's navigation
+        # Poisoned subtrees have nothing left to explore - don't pay to reach them
+        target_state = self.discovered_states.get(target_state_id)
+        if target_state and target_state.is_deadend:
+            return False
+        
         try:
-            return self.element_interactor.navigate_back_to_state(target_state_id)
+            path = self._path_between(current_state_id, target_state_id)
+            if path is None:
+                # Not both in our tree - fall back to the interactor's generic backtracking
+                return self.element_interactor.navigate_back_to_state(target_state_id)
+            
+            # Back out one level at a time up to the common ancestor...
+            up_states, down_states = path
+            for state_id in up_states:
+                if not self.element_interactor.navigate_back_to_state(state_id):
+                    return False
+                self.element_interactor.current_state_id = state_id
+            
+            # ...then replay the recorded trigger edges down to the target
+            if down_states:
+                ancestor = up_states[-1] if up_states else current_state_id
+                return self.element_interactor.navigation_engine.navigate_to_state(target_state_id, ancestor)
+            return True
         except Exception as e:
             self.console.print(f"[yellow]⚠️ Navigation failed: {e}[/yellow]")
             return False
     
+    def _ancestor_chain(self, state_id: str) -> List[str]:
+        """State followed by its parents up to the root of the exploration tree"""
+        
+        chain = []
+        while state_id is not None and state_id in self.discovered_states:
+            chain.append(state_id)
+            state_id = self.discovered_states[state_id].parent_state
+        return chain
+    
+    def _path_between(self, source_state_id: str, target_state_id: str) -> Optional[Tuple[List[str], List[str]]]:
+        """
+        Shortest tree path between two discovered states via their lowest common ancestor
+        
+        Returns (states to back out into, states to descend through), or None when
+        either state is outside the exploration tree.
+        """
+        
+        source_chain = self._ancestor_chain(source_state_id)
+        target_chain = self._ancestor_chain(target_state_id)
+        if not source_chain or not target_chain:
+            return None
+        
+        target_positions = {state_id: i for i, state_id in enumerate(target_chain)}
+        for i, state_id in enumerate(source_chain):
+            if state_id in target_positions:
+                up_states = source_chain[1:i + 1]
+                down_states = list(reversed(target_chain[:target_positions[state_id]]))
+                return up_states, down_states
+        return None
+    
     def _check_time_limit(self) -> bool:
         """Check if we've exceeded the total exploration time limit"""
         
         if not self.strategy.safety_timeouts:
             return True
             
-        if not self.stats['exploration_start_time']:
+        if self._start_monotonic is None:
             return True
         
-        elapsed = (datetime.now() - self.stats['exploration_start_time']).total_seconds()
-        return elapsed < self.strategy.total_timeout
+        return (time.monotonic() - self._start_monotonic) < self.strategy.total_timeout
     
-    def _monitor_focus_status(self) -> None:
-        """Monitor window focus status and update statistics"""
+    def _monitor_focus_status(self, force: bool = False) -> None:
+        """Sample window focus status every 20 interactions (or when forced) and update statistics"""
+        # Purely observational and the failure count only grows, so sampling loses nothing
+        if not force and self.total_interactions % 20:
+            return
+        
         try:
-            if (self.element_interactor and 
-                hasattr(self.element_interactor, 'window_focus_manager') and
-                self.element_interactor.window_focus_manager):
-                
-                focus_manager = self.element_interactor.window_focus_manager
+            focus_manager = getattr(self.element_interactor, 'window_focus_manager', None)
+            if focus_manager:
                 focus_status = focus_manager.get_focus_status_summary()
                 
                 # Update statistics
-                current_failures = focus_status.get('focus_failure_count', 0)
-                if current_failures > self.stats['focus_failures']:
-                    self.stats['focus_failures'] = current_failures
+                current_failures = focus_status.focus_failure_count
+                if current_failures > self.focus_failures:
+                    self.focus_failures = current_failures
                 
                 # Check if focus verification is disabled (indication of recovery issues)
-                if not focus_status.get('focus_verification_enabled', True):
+                verification_enabled = focus_status.focus_verification_enabled
+                if not verification_enabled:
                     self.console.print("[yellow]⚠️ Window focus verification has been disabled due to repeated failures[/yellow]")
                 
-                # Log focus status periodically
-                if self.stats['total_interactions'] % 20 == 0 and self.stats['total_interactions'] > 0:  # Every 20 interactions
-                    self.console.print(f"[dim]🎯 Focus Status: {current_failures} failures, verification {'enabled' if focus_status.get('focus_verification_enabled', True) else 'disabled'}[/dim]")
+                self.console.print(f"[dim]🎯 Focus Status: {current_failures} failures, verification {'enabled' if verification_enabled else 'disabled'}[/dim]")
                     
         except Exception as e:
             self.console.print(f"[dim yellow]⚠️ Focus monitoring error: {e}[/dim]")
@@ -481,10 +817,12 @@ class DeepExplorer:
     def _generate_exploration_report(self) -> Dict:
         """Generate comprehensive exploration report"""
         
-        self.stats['exploration_end_time'] = datetime.now()
+        self.exploration_end_time = datetime.now()
+        # Catch focus failures since the last periodic sample
+        self._monitor_focus_status(force=True)
         
-        if self.stats['exploration_start_time']:
-            duration = self.stats['exploration_end_time'] - self.stats['exploration_start_time']
+        if self.exploration_start_time:
+            duration = self.exploration_end_time - self.exploration_start_time
             duration_seconds = duration.total_seconds()
         else:
             duration_seconds = 0
@@ -494,32 +832,22 @@ class DeepExplorer:
             "success": True,
             "exploration_summary": {
                 "total_duration_seconds": duration_seconds,
-                "total_states_discovered": self.stats['total_states_discovered'],
-                "total_elements_discovered": self.stats['total_elements_discovered'],
-                "total_interactions": self.stats['total_interactions'],
-                "successful_interactions": self.stats['successful_interactions'],
-                "failed_interactions": self.stats['failed_interactions'],
-                "success_rate": (self.stats['successful_interactions'] / max(1, self.stats['total_interactions'])) * 100,
-                "dialogs_discovered": self.stats['dialogs_discovered'],
-                "menus_discovered": self.stats['menus_discovered'],
-                "deadends_found": self.stats['deadends_found'],
-                "max_depth_reached": self.stats['max_depth_reached'],
-                "focus_failures": self.stats['focus_failures'],
-                "focus_recoveries": self.stats['focus_recoveries']
+                "total_states_discovered": self.total_states_discovered,
+                "total_elements_discovered": self.total_elements_discovered,
+                "total_interactions": self.total_interactions,
+                "successful_interactions": self.successful_interactions,
+                "failed_interactions": self.failed_interactions,
+                "success_rate": (self.successful_interactions / max(1, self.total_interactions)) * 100,
+                "dialogs_discovered": self.dialogs_discovered,
+                "menus_discovered": self.menus_discovered,
+                "deadends_found": self.deadends_found,
+                "max_depth_reached": self.max_depth_reached,
+                "depth_distribution": dict(self._states_per_depth),
+                "focus_failures": self.focus_failures,
+                "focus_recoveries": self.focus_recoveries
             },
             "discovered_states": {
-                state_id: {
-                    "depth": state.depth,
-                    "parent_state": state.parent_state,
-                    "trigger_element": state.trigger_element,
-                    "element_count": state.element_count,
-                    "explored": state.explored,
-                    "is_deadend": state.is_deadend,
-                    "is_dialog": state.is_dialog,
-                    "is_menu": state.is_menu,
-                    "discovered_at": state.discovered_at.isoformat()
-                }
-                for state_id, state in self.discovered_states.items()
+                state_id: self._state_record(state) for state_id, state in self.discovered_states.items()
             },
             "exploration_graph": dict(self.exploration_graph),
             "strategy_used": {
@@ -533,6 +861,9 @@ class DeepExplorer:
             }
         }
         
+        # Keep what this run learned for the next warm start
+        self._save_explorer_cache()
+        
         # Display report summary
         self._display_exploration_summary(report)
         
@@ -573,21 +904,25 @@ class DeepExplorer:
         
         tree = Tree("🌳 Discovered State Hierarchy")
         
-        # Build tree recursively
-        root_states = [s for s in self.discovered_states.values() if s.parent_state is None]
+        # Build tree depth-first with an explicit stack; children are pushed
+        # in reverse so siblings are added in their discovery order
+        root_states = [s.state_id for s in self.discovered_states.values() if s.parent_state is None]
+        stack = [(tree, state_id) for state_id in reversed(root_states)]
         
-        for root_state in root_states:
-            self._add_state_to_tree(tree, root_state.state_id)
+        while stack:
+            parent_node, state_id = stack.pop()
+            node, child_states = self._add_state_to_tree(parent_node, state_id)
+            if node is not None:
+                stack.extend((node, child_id) for child_id in reversed(child_states))
         
         self.console.print(tree)
     
-    def _add_state_to_tree(self, parent_node, state_id: str) -> None:
-        """Recursively add states to the tree"""
-        
-        if state_id not in self.discovered_states:
-            return
+    def _add_state_to_tree(self, parent_node, state_id: str) -> Tuple[Optional[Tree], List[str]]:
+        """Add one state to the tree, returning its node and the children still to add"""
         
-        state = self.discovered_states[state_id]
+        state = self.discovered_states.get(state_id)
+        if state is None:
+            return None, []
         
         # Create state description
         state_desc = f"{state_id} (depth {state.depth}, {state.element_count} elements)"
@@ -601,33 +936,116 @@ class DeepExplorer:
         if not state.explored:
             state_desc += " ⏳"
         
-        node = parent_node.add(state_desc)
-        
-        # Add child states
+        # Collapse subtrees poisoned as dead ends
         child_states = self.exploration_graph.get(state_id, [])
-        for child_state_id in child_states:
-            self._add_state_to_tree(node, child_state_id)
+        if state.is_deadend and child_states:
+            parent_node.add(f"{state_desc} ({len(child_states)} dead-end children)")
+            return None, []
+        
+        return parent_node.add(state_desc), child_states
     
     def _save_exploration_report(self, report: Dict) -> None:
         """Save the detailed exploration report to file"""
         
         try:
-            app_name = getattr(self.state_manager, 'app_name', 'unknown_app')
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             
-            apps_dir = Path(__file__).parent / "apps" / app_name
-            apps_dir.mkdir(parents=True, exist_ok=True)
+            # Not set if exploration stopped before initialization finished
+            if self._apps_dir is None:
+                self._apps_dir = self._resolve_apps_dir()
             
-            report_file = apps_dir / f"deep_exploration_report_{timestamp}.json"
+            report_file = self._apps_dir / f"deep_exploration_report_{timestamp}.json"
             
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(report, f, indent=2, ensure_ascii=False, default=str)
+            # Serialize now (the report dict may still be mutated by callers), write in the background
+            if orjson is not None:
+                data = orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(report, indent=2, ensure_ascii=False, default=str).encode('utf-8')
             
-            self.console.print(f"[green]💾 Detailed report saved to: {report_file}[/green]")
+            # Non-daemon worker: the interpreter waits for a pending write before exiting
+            future = _REPORT_WRITER.submit(report_file.write_bytes, data)
+            future.add_done_callback(lambda f: self._report_write_done(f, report_file))
             
         except Exception as e:
             self.console.print(f"[yellow]⚠️ Could not save report: {e}[/yellow]")
     
+    def _load_explorer_cache(self) -> None:
+        """
+        Restore state classifications and dead element signatures from an earlier run
+        
+        Node statuses and transitions already come back through fdom.json; this
+        covers what only the explorer knows, so resumed states keep their
+        dialog/menu flags and known dead widgets are skipped from the first click.
+        """
+        
+        cache_file = self._apps_dir / EXPLORER_CACHE_FILE
+        if not cache_file.exists():
+            return
+        
+        try:
+            cache = json.loads(cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError) as e:
+            self.console.print(f"[yellow]⚠️ Ignoring unreadable explorer cache: {e}[/yellow]")
+            return
+        
+        for name, element_type, count in cache.get("dead_signatures", []):
+            self._dead_signatures[(name, element_type)] = count
+        
+        for state_id, flags in cache.get("states", {}).items():
+            state = self.discovered_states.get(state_id)
+            if state is None:
+                continue
+            if flags.get("is_dialog") and not state.is_dialog:
+                state.is_dialog = True
+                self.dialogs_discovered += 1
+            if flags.get("is_menu") and not state.is_menu:
+                state.is_menu = True
+                self.menus_discovered += 1
+            # Only trust a cached dead end if the fDOM agrees nothing is left to click
+            if flags.get("is_deadend") and not state.is_deadend and not self._get_pending_elements_for_state(state_id):
+                state.is_deadend = True
+                self.deadends_found += 1
+        
+        self.console.print(f"[green]♻️ Warm start: {len(self._dead_signatures)} known dead signatures, {len(cache.get('states', {}))} classified states[/green]")
+    
+    def _save_explorer_cache(self) -> None:
+        """Persist state classifications and dead element signatures for the next run"""
+        
+        if self._apps_dir is None:
+            return
+        
+        cache = {
+            "saved_at": datetime.now().isoformat(),
+            "dead_signatures": [[name, element_type, count] for (name, element_type), count in self._dead_signatures.items()],
+            "states": {
+                state_id: {"is_dialog": state.is_dialog, "is_menu": state.is_menu, "is_deadend": state.is_deadend}
+                for state_id, state in self.discovered_states.items()
+                if state.is_dialog or state.is_menu or state.is_deadend
+            }
+        }
+        
+        try:
+            (self._apps_dir / EXPLORER_CACHE_FILE).write_text(json.dumps(cache, indent=2, ensure_ascii=False), encoding='utf-8')
+        except OSError as e:
+            self.console.print(f"[yellow]⚠️ Could not save explorer cache: {e}[/yellow]")
+    
+    def _resolve_apps_dir(self) -> Path:
+        """Create and return the apps/<app_name> directory for this run"""
+        
+        app_name = getattr(self.state_manager, 'app_name', 'unknown_app')
+        apps_dir = Path(__file__).parent / "apps" / app_name
+        apps_dir.mkdir(parents=True, exist_ok=True)
+        return apps_dir
+    
+    def _report_write_done(self, future: Future, report_file: Path) -> None:
+        """Report the outcome of a background report write"""
+        
+        error = future.exception()
+        if error:
+            self.console.print(f"[yellow]⚠️ Could not save report: {error}[/yellow]")
+        else:
+            self.console.print(f"[green]💾 Detailed report saved to: {report_file}[/green]")
+    
     def _create_failure_result(self, error_message: str) -> Dict:
         """Create a failure result dictionary"""
         
@@ -639,7 +1057,7 @@ class DeepExplorer:
                 state_id: {
                     "depth": state.depth,
                     "element_count": state.element_count,
-                    "discovered_at": state.discovered_at.isoformat()
+                    "discovered_at": datetime.fromtimestamp(state.discovered_at).isoformat()
                 }
                 for state_id, state in self.discovered_states.items()
             }
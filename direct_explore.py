@@ -15,6 +15,9 @@ APP_PATH = 'C:/Program Files/VideoLAN/VLC/vlc.exe'
 APP_NAME = "vlc"
 ITERATIONS = 50
 
+# Nodes clicked per ElementInteractor.chain() call
+CHAIN_SIZE = 5
+
 def run_automated_exploration():
     """Run fully automated exploration without interactive prompts"""
     print(f"Starting automated exploration of {APP_PATH}")
@@ -42,44 +45,40 @@ def run_automated_exploration():
     print(f"Starting exploration of up to {ITERATIONS} nodes...")
     
     while explored_count < ITERATIONS:
-        # Get list of pending nodes
-        pending_nodes = list(interactor.state_manager.pending_nodes)
+        # Click the next few pending nodes as one chain (single fdom.json write per batch)
+        batch = []
+        while len(batch) < min(CHAIN_SIZE, ITERATIONS - explored_count):
+            node_id = interactor.state_manager.pop_next_pending()
+            if node_id is None or node_id in batch:
+                break
+            batch.append(node_id)
         
-        if not pending_nodes:
+        if not batch:
             print("No more pending nodes to explore.")
             break
         
-        # Get next node
-        node_id = pending_nodes[0]
-        
-        # Get node info
-        node_data = interactor._find_node_in_fdom(node_id)
-        element_name = node_data.get('g_icon_name', 'unknown') if node_data else 'unknown'
+        for offset, node_id in enumerate(batch, 1):
+            node_data = interactor._find_node_in_fdom(node_id)
+            element_name = node_data.get('g_icon_name', 'unknown') if node_data else 'unknown'
+            print(f"\n[{explored_count + offset}/{ITERATIONS}] Queued: {element_name} ({node_id})")
         
-        print(f"\n[{explored_count + 1}/{ITERATIONS}] Exploring: {element_name} ({node_id})")
+        results = interactor.chain(batch)
         
-        # Click the element
-        try:
-            result = interactor.click_element(node_id)
-            
+        for node_id, result in zip(batch, results):
             if result.success:
                 successful_count += 1
                 if result.state_changed:
-                    print(f"Success: State changed to {result.new_state_id}")
+                    print(f"Success: {node_id} changed state to {result.new_state_id}")
                 else:
-                    print(f"Success: Element marked as {result.interaction_type}")
+                    print(f"Success: {node_id} marked as {result.interaction_type}")
             else:
-                print(f"Failed: {result.error_message}")
+                print(f"Failed: {node_id}: {result.error_message}")
             
             # Increment counter
             explored_count += 1
-            
-            # Small delay between explorations
-            time.sleep(2)
-            
-        except Exception as e:
-            print(f"Error exploring {node_id}: {e}")
-            explored_count += 1
+        
+        # Let the UI settle before the next batch
+        interactor.wait_for_idle()
     
     # Print summary
     print("\n=== Exploration Summary ===")
@@ -5,27 +5,31 @@ Combines the power of the Deep Explorer with full automation for comprehensive a
 This script runs without user interaction and provides exhaustive coverage of app functionality.
 """
 
-import os
 import sys
-import time
 import json
 import argparse
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Mapping
 from datetime import datetime
+from collections import ChainMap
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Reports fall back to the stdlib json encoder
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
+# Rich and the fDOM stack (via deep_explore) are imported where first used, so
+# --help and argument validation don't pay for loading them
+if TYPE_CHECKING:
+    from deep_explore import DeepExplorer
 
-# Import our modules
-from deep_explore import DeepExplorer, ExplorationStrategy
-from utils.fdom.element_interactor import ElementInteractor
-from utils.fdom.state_manager import StateManager
+# Seconds between on-disk snapshots of exploration counters during a run
+CHECKPOINT_INTERVAL = 30
 
 class EnhancedAutoExplorer:
     """
@@ -33,10 +37,21 @@ class EnhancedAutoExplorer:
     """
     
     def __init__(self, app_executable_path: str, max_runtime_minutes: int = 60):
+        from rich.console import Console
+        from rich.panel import Panel
+        from deep_explore import ExplorationStrategy
+        
         self.console = Console()
         self.app_executable_path = app_executable_path
         self.max_runtime_minutes = max_runtime_minutes
         
+        # Path pieces reused by every report/checkpoint/stream file
+        app_path = Path(app_executable_path)
+        self._app_name_display = app_path.name
+        self._app_stem = app_path.stem
+        self._reports_dir = Path(__file__).parent / "automation_reports"
+        self._reports_dir.mkdir(exist_ok=True)
+        
         # Create aggressive exploration strategy for automated use
         self.exploration_strategy = ExplorationStrategy(
             max_depth=8,                      # Deep exploration
@@ -54,7 +69,7 @@ class EnhancedAutoExplorer:
         
         self.console.print(Panel(
             f"[bold]🤖 Enhanced Auto Explorer[/bold]\n\n"
-            f"🎯 Target: {Path(app_executable_path).name}\n"
+            f"🎯 Target: {self._app_name_display}\n"
             f"⏱️ Runtime Limit: {max_runtime_minutes} minutes\n"
             f"🔍 Strategy: Comprehensive automated deep exploration\n"
             f"📊 Max States: {self.exploration_strategy.max_total_states}\n"
@@ -63,7 +78,7 @@ class EnhancedAutoExplorer:
             border_style="blue"
         ))
     
-    def run_automated_analysis(self) -> Dict:
+    def run_automated_analysis(self) -> Mapping:
         """
         Run fully automated comprehensive analysis
         """
@@ -71,15 +86,35 @@ class EnhancedAutoExplorer:
         
         self.console.print("\n[bold green]🤖 Starting automated comprehensive analysis...[/bold green]")
         
+        from deep_explore import DeepExplorer
+        
         try:
-            # Initialize deep explorer
+            # One explorer for the whole app: per-branch worker processes would all
+            # rewrite apps/<app>/fdom.json and share a single mouse and foreground window
             deep_explorer = DeepExplorer(self.app_executable_path, self.exploration_strategy)
             
-            # Run deep exploration
-            result = deep_explorer.run_deep_exploration()
+            # Run deep exploration on this thread (its UIA/COM objects live here);
+            # checkpointing happens on a side thread instead
+            stop_checkpoints = threading.Event()
+            checkpointer = threading.Thread(
+                target=self._periodic_checkpoint, args=(deep_explorer, stop_checkpoints),
+                name="automation-checkpoint", daemon=True
+            )
+            checkpointer.start()
+            
+            # Stream each state as a JSON line as soon as it is discovered
+            states_file = self._reports_dir / f"auto_analysis_{self._app_stem}_{start_time:%Y%m%d_%H%M%S}_states.jsonl"
+            with open(states_file, 'ab') as states_stream:
+                deep_explorer.on_state_added = lambda state_id, record: self._stream_state_record(states_stream, state_id, record)
+                try:
+                    result = deep_explorer.run_deep_exploration()
+                finally:
+                    deep_explorer.on_state_added = None
+                    stop_checkpoints.set()
+                    checkpointer.join()
             
             # Enhance result with automation-specific analysis
-            enhanced_result = self._enhance_analysis_result(result, start_time)
+            enhanced_result = self._enhance_analysis_result(result, start_time, states_file)
             
             # Generate automated report
             self._generate_automated_report(enhanced_result)
@@ -94,7 +129,30 @@ class EnhancedAutoExplorer:
                 "analysis_duration": (datetime.now() - start_time).total_seconds()
             }
     
-    def _enhance_analysis_result(self, deep_result: Dict, start_time: datetime) -> Dict:
+    @staticmethod
+    def _stream_state_record(stream, state_id: str, record: Dict) -> None:
+        """Append one discovered state as a JSON line, flushed so it survives a crash"""
+        line = {"state_id": state_id, **record}
+        if orjson is not None:
+            stream.write(orjson.dumps(line, default=str))
+        else:
+            stream.write(json.dumps(line, ensure_ascii=False, default=str).encode('utf-8'))
+        stream.write(b"\n")
+        stream.flush()
+    
+    def _periodic_checkpoint(self, deep_explorer: "DeepExplorer", stop: threading.Event,
+                             interval: float = CHECKPOINT_INTERVAL) -> None:
+        """Snapshot the explorer's counters to disk every `interval` seconds until stopped"""
+        
+        checkpoint_file = self._reports_dir / f"auto_analysis_{self._app_stem}_checkpoint.json"
+        while not stop.wait(interval):
+            try:
+                snapshot = {"checkpoint_time": datetime.now().isoformat(), "stats": deep_explorer.stats}
+                checkpoint_file.write_text(json.dumps(snapshot, indent=2, default=str), encoding='utf-8')
+            except Exception as e:
+                self.console.print(f"[dim yellow]⚠️ Checkpoint failed: {e}[/dim]")
+    
+    def _enhance_analysis_result(self, deep_result: Dict, start_time: datetime, states_file: Path) -> Mapping:
         """
         Enhance the deep exploration result with automation-specific analysis
         """
@@ -106,91 +164,100 @@ class EnhancedAutoExplorer:
         discovered_states = deep_result.get("discovered_states", {})
         
         # Calculate automation-specific metrics
+        state_analysis = self._analyze_states(summary, len(discovered_states))
         automation_metrics = {
-            "coverage_efficiency": self._calculate_coverage_efficiency(summary),
+            "coverage_efficiency": self._calculate_coverage_efficiency(
+                total_interactions=summary.get("total_interactions", 1),
+                total_states=summary.get("total_states_discovered", 1)
+            ),
             "discovery_rate": summary.get("total_states_discovered", 0) / max(1, total_duration / 60),  # states per minute
             "interaction_success_rate": summary.get("success_rate", 0),
-            "depth_coverage": self._analyze_depth_coverage(discovered_states),
-            "functionality_coverage": self._analyze_functionality_coverage(discovered_states),
+            "depth_coverage": state_analysis["depth"],
+            "functionality_coverage": state_analysis["functionality"],
             "automation_score": 0  # Will be calculated below
         }
         
         # Calculate overall automation score (0-100)
-        automation_metrics["automation_score"] = self._calculate_automation_score(automation_metrics, summary)
+        automation_metrics["automation_score"] = self._calculate_automation_score(
+            success_rate=summary.get("success_rate", 0),
+            coverage_efficiency=automation_metrics["coverage_efficiency"],
+            discovery_rate=automation_metrics["discovery_rate"],
+            deep_states_ratio=automation_metrics["depth_coverage"]["deep_states_ratio"],
+            functionality_diversity=automation_metrics["functionality_coverage"]["functionality_diversity"]
+        )
         
-        # Enhanced result
-        enhanced_result = deep_result.copy()
-        enhanced_result.update({
+        # Enhanced result: automation analysis layered over the (unowned, unmodified) deep result
+        return ChainMap({
+            "discovered_states_stream": str(states_file),
             "automation_analysis": {
                 "total_runtime_minutes": total_duration / 60,
                 "automation_metrics": automation_metrics,
-                "efficiency_assessment": self._assess_efficiency(automation_metrics),
-                "coverage_assessment": self._assess_coverage(automation_metrics, summary),
+                "efficiency_assessment": self._assess_efficiency(automation_metrics["discovery_rate"]),
+                "coverage_assessment": self._assess_coverage(automation_metrics["automation_score"]),
                 "recommendations": self._generate_recommendations(automation_metrics, summary)
             }
-        })
-        
-        return enhanced_result
+        }, deep_result)
     
-    def _calculate_coverage_efficiency(self, summary: Dict) -> float:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _calculate_coverage_efficiency(*, total_interactions: int, total_states: int) -> float:
         """Calculate how efficiently we covered the application"""
-        total_interactions = summary.get("total_interactions", 1)
-        total_states = summary.get("total_states_discovered", 1)
-        
         # Efficiency = states discovered per interaction
         return total_states / max(1, total_interactions) * 100
     
-    def _analyze_depth_coverage(self, discovered_states: Dict) -> Dict:
-        """Analyze coverage across different depths"""
-        depth_counts = {}
-        total_states = len(discovered_states)
+    def _analyze_states(self, summary: Dict, total_states: int) -> Dict:
+        """Analyze depth and functionality coverage from the explorer's running counters"""
+        depth_counts = summary.get("depth_distribution", {})
+        dialog_count = summary.get("dialogs_discovered", 0)
+        menu_count = summary.get("menus_discovered", 0)
+        deadend_count = summary.get("deadends_found", 0)
         
-        for state_data in discovered_states.values():
-            depth = state_data.get("depth", 0)
-            depth_counts[depth] = depth_counts.get(depth, 0) + 1
+        # One walk over the (depth -> count) histogram, which has at most max_depth + 1 entries
+        depth_sum = deep_states = max_depth = 0
+        for depth, count in depth_counts.items():
+            depth_sum += depth * count
+            if depth >= 3:
+                deep_states += count
+            if depth > max_depth:
+                max_depth = depth
         
         return {
-            "depth_distribution": depth_counts,
-            "max_depth_reached": max(depth_counts.keys()) if depth_counts else 0,
-            "average_depth": sum(d * c for d, c in depth_counts.items()) / max(1, total_states),
-            "deep_states_ratio": sum(c for d, c in depth_counts.items() if d >= 3) / max(1, total_states)
-        }
-    
-    def _analyze_functionality_coverage(self, discovered_states: Dict) -> Dict:
-        """Analyze what types of functionality were discovered"""
-        total_states = len(discovered_states)
-        dialog_count = sum(1 for s in discovered_states.values() if s.get("is_dialog", False))
-        menu_count = sum(1 for s in discovered_states.values() if s.get("is_menu", False))
-        deadend_count = sum(1 for s in discovered_states.values() if s.get("is_deadend", False))
-        
-        return {
-            "dialog_coverage": dialog_count / max(1, total_states) * 100,
-            "menu_coverage": menu_count / max(1, total_states) * 100,
-            "deadend_ratio": deadend_count / max(1, total_states) * 100,
-            "functional_states": total_states - deadend_count,
-            "functionality_diversity": len([t for t in ["dialog", "menu"] if 
-                                          (t == "dialog" and dialog_count > 0) or 
-                                          (t == "menu" and menu_count > 0)])
+            "depth": {
+                "depth_distribution": depth_counts,
+                "max_depth_reached": max_depth,
+                "average_depth": depth_sum / max(1, total_states),
+                "deep_states_ratio": deep_states / max(1, total_states)
+            },
+            "functionality": {
+                "dialog_coverage": dialog_count / max(1, total_states) * 100,
+                "menu_coverage": menu_count / max(1, total_states) * 100,
+                "deadend_ratio": deadend_count / max(1, total_states) * 100,
+                "functional_states": total_states - deadend_count,
+                "functionality_diversity": (dialog_count > 0) + (menu_count > 0)
+            }
         }
     
-    def _calculate_automation_score(self, automation_metrics: Dict, summary: Dict) -> float:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _calculate_automation_score(*, success_rate: float, coverage_efficiency: float, discovery_rate: float,
+                                    deep_states_ratio: float, functionality_diversity: int) -> float:
         """Calculate overall automation effectiveness score (0-100)"""
         
         # Weighted scoring components
         components = {
-            "success_rate": summary.get("success_rate", 0) * 0.3,          # 30% weight
-            "coverage_efficiency": automation_metrics["coverage_efficiency"] * 0.2,  # 20% weight
-            "discovery_rate": min(automation_metrics["discovery_rate"] * 10, 100) * 0.2,  # 20% weight
-            "depth_coverage": automation_metrics["depth_coverage"]["deep_states_ratio"] * 100 * 0.15,  # 15% weight
-            "functionality_diversity": automation_metrics["functionality_coverage"]["functionality_diversity"] * 50 * 0.15  # 15% weight
+            "success_rate": success_rate * 0.3,                            # 30% weight
+            "coverage_efficiency": coverage_efficiency * 0.2,              # 20% weight
+            "discovery_rate": min(discovery_rate * 10, 100) * 0.2,         # 20% weight
+            "depth_coverage": deep_states_ratio * 100 * 0.15,              # 15% weight
+            "functionality_diversity": functionality_diversity * 50 * 0.15  # 15% weight
         }
         
         return sum(components.values())
     
-    def _assess_efficiency(self, automation_metrics: Dict) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _assess_efficiency(discovery_rate: float) -> str:
         """Assess automation efficiency"""
-        discovery_rate = automation_metrics["discovery_rate"]
-        
         if discovery_rate >= 5:
             return "Excellent - Very high discovery rate"
         elif discovery_rate >= 3:
@@ -200,10 +267,10 @@ class EnhancedAutoExplorer:
         else:
             return "Poor - Low discovery rate"
     
-    def _assess_coverage(self, automation_metrics: Dict, summary: Dict) -> str:
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _assess_coverage(automation_score: float) -> str:
         """Assess coverage comprehensiveness"""
-        automation_score = automation_metrics["automation_score"]
-        
         if automation_score >= 80:
             return "Excellent - Comprehensive coverage achieved"
         elif automation_score >= 60:
@@ -238,8 +305,9 @@ class EnhancedAutoExplorer:
         
         return recommendations
     
-    def _generate_automated_report(self, result: Dict) -> None:
+    def _generate_automated_report(self, result: Mapping) -> None:
         """Generate and display automated analysis report"""
+        from rich.panel import Panel
         
         if not result.get("success", False):
             self.console.print(Panel(
@@ -290,20 +358,27 @@ class EnhancedAutoExplorer:
         # Save detailed report
         self._save_automation_report(result)
     
-    def _save_automation_report(self, result: Dict) -> None:
+    def _save_automation_report(self, result: Mapping) -> None:
         """Save detailed automation report to file"""
         
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            app_name = Path(self.app_executable_path).stem
-            
-            reports_dir = Path(__file__).parent / "automation_reports"
-            reports_dir.mkdir(exist_ok=True)
-            
-            report_file = reports_dir / f"auto_analysis_{app_name}_{timestamp}.json"
+            report_file = self._reports_dir / f"auto_analysis_{self._app_stem}_{timestamp}.json"
             
-            with open(report_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, ensure_ascii=False, default=str)
+            # Per-state records already live in the JSONL stream; the report only points at it.
+            # The exploration graph is left out too: each streamed record carries its parent and trigger
+            report = {
+                "success": result.get("success", False),
+                "exploration_summary": result.get("exploration_summary", {}),
+                "strategy_used": result.get("strategy_used", {}),
+                "automation_analysis": result.get("automation_analysis", {}),
+                "discovered_states_stream": result.get("discovered_states_stream"),
+            }
+            if orjson is not None:
+                data = orjson.dumps(report, default=str, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(report, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+            report_file.write_bytes(data)
             
             self.console.print(f"[green]💾 Detailed automation report saved to: {report_file}[/green]")
             
@@ -322,16 +397,21 @@ def main():
     parser.add_argument("--no-dialogs", action="store_true", help="Skip dialog exploration")
     parser.add_argument("--no-menus", action="store_true", help="Skip menu exploration")
     parser.add_argument("--no-context", action="store_true", help="Skip context menu exploration")
+    parser.add_argument("--cold-start", action="store_true", help="Ignore the explorer cache from earlier runs")
+    parser.add_argument("--resume", action="store_true",
+                        help="Skip re-clicking elements that did nothing on an identical screen in earlier runs")
     
     args = parser.parse_args()
     
-    console = Console()
-    
     # Validate app path
     if not Path(args.app_path).exists():
-        console.print(f"[red]❌ Application not found: {args.app_path}[/red]")
+        print(f"❌ Application not found: {args.app_path}", file=sys.stderr)
         return 1
     
+    if args.resume:
+        from utils.fdom.config_manager import ConfigManager
+        ConfigManager.shared().update("interaction.memoize_non_interactive", True)
+    
     # Create enhanced auto explorer
     explorer = EnhancedAutoExplorer(args.app_path, args.runtime)
     
@@ -346,6 +426,8 @@ def main():
         explorer.exploration_strategy.explore_menus = False
     if args.no_context:
         explorer.exploration_strategy.explore_context_menus = False
+    if args.cold_start:
+        explorer.exploration_strategy.warm_start = False
     
     # Run automated analysis
     result = explorer.run_automated_analysis()
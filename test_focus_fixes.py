@@ -4,101 +4,80 @@ Test script to verify window focus management fixes
 Tests the new WindowFocusManager integration
 """
 
+import argparse
 import sys
-import time
+from dataclasses import asdict
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from rich.console import Console
 from rich.panel import Panel
-from utils.fdom.window_focus_manager import WindowFocusManager
-from utils.fdom.element_interactor import ElementInteractor
-from utils.fdom.config_manager import ConfigManager
+from rich.table import Table
+
+# Shared by every test so terminal detection runs once
+_CONSOLE = Console()
+
+# Static panels are built once at import and reused by every run
+_INTEGRATION_PANEL = Panel(
+    "[bold]🔧 Testing Window Focus Management Fixes[/bold]\n\n"
+    "This script tests the new focus management system to prevent\n"
+    "clicks on wrong windows during exploration.",
+    title="🧪 Focus Management Test",
+    border_style="blue"
+)
+
+_SUITE_PANEL = Panel(
+    "[bold green]🔧 Window Focus Management Test Suite[/bold green]\n\n"
+    "This script tests the fixes for window focus issues during exploration.\n"
+    "The fixes include:\n"
+    "• WindowFocusManager with smart focus recovery\n"
+    "• Integration with ScreenshotManager and ClickEngine\n"
+    "• Focus monitoring during deep exploration\n"
+    "• Automatic window focus recovery mechanisms",
+    title="🧪 Focus Fix Verification",
+    border_style="green"
+)
+
+# Distinguishes a missing focus_manager attribute from one set to None
+_MISSING = object()
 
-def test_focus_manager_integration():
+# Used when no --app-path is given and nobody is at the terminal to ask
+DEFAULT_APP_PATH = r"C:\Windows\System32\notepad.exe"
+
+def _yes(prompt: str) -> bool:
+    """Ask a y/n question on stdin; anything not starting with y/Y is a no"""
+    return (input(prompt) or "")[:1] in {'y', 'Y'}
+
+def test_focus_manager_integration(app_path: str = None, launch: bool = None):
     """Test the focus manager integration with element interactor"""
     
-    console = Console()
+    console = _CONSOLE
     
-    console.print(Panel(
-        "[bold]🔧 Testing Window Focus Management Fixes[/bold]\n\n"
-        "This script tests the new focus management system to prevent\n"
-        "clicks on wrong windows during exploration.",
-        title="🧪 Focus Management Test",
-        border_style="blue"
-    ))
+    console.print(_INTEGRATION_PANEL)
     
-    # Get application path from user
-    app_path = input("\n📱 Enter application executable path to test: ").strip()
-    if not app_path:
-        console.print("[red]❌ No application path provided[/red]")
-        return False
+    # Only prompt when no flag was given and someone is at the terminal
+    if app_path is None:
+        if sys.stdin.isatty():
+            app_path = input(f"\n📱 Enter application executable path to test [{DEFAULT_APP_PATH}]: ").strip()
+        app_path = app_path or DEFAULT_APP_PATH
     
     try:
+        # Deferred so the fdom stack only loads once a path was given
+        from utils.fdom.element_interactor import ElementInteractor
+        
         console.print(f"\n[yellow]🚀 Initializing ElementInteractor with focus management...[/yellow]")
         
         # Initialize element interactor (this will create the focus manager)
         element_interactor = ElementInteractor(app_path)
         
-        # Check if focus manager was created
-        if hasattr(element_interactor, 'window_focus_manager'):
-            console.print(f"[green]✅ WindowFocusManager initialized successfully[/green]")
-            
-            focus_manager = element_interactor.window_focus_manager
-            console.print(f"[cyan]📊 Focus manager status:[/cyan]")
-            console.print(f"  - Focus verification enabled: {focus_manager.focus_verification_enabled}")
-            console.print(f"  - Auto recovery enabled: {focus_manager.auto_recovery_enabled}")
-            console.print(f"  - Max focus failures: {focus_manager.max_focus_failures}")
-            
-            # Test the focus status method
-            focus_status = focus_manager.get_focus_status_summary()
-            console.print(f"\n[cyan]📋 Focus status summary:[/cyan]")
-            for key, value in focus_status.items():
-                console.print(f"  - {key}: {value}")
-                
-        else:
-            console.print(f"[red]❌ WindowFocusManager not found in ElementInteractor[/red]")
+        if not _check_attributes(element_interactor):
             return False
         
-        # Check other component integrations
-        console.print(f"\n[yellow]🔍 Checking component integrations...[/yellow]")
-        
-        # Check ScreenshotManager integration
-        if hasattr(element_interactor.screenshot_manager, 'focus_manager'):
-            if element_interactor.screenshot_manager.focus_manager:
-                console.print(f"[green]✅ ScreenshotManager has focus manager[/green]")
-            else:
-                console.print(f"[yellow]⚠️ ScreenshotManager focus manager is None[/yellow]")
-        else:
-            console.print(f"[red]❌ ScreenshotManager missing focus manager attribute[/red]")
-        
-        # Check ClickEngine integration
-        if hasattr(element_interactor.click_engine, 'focus_manager'):
-            if element_interactor.click_engine.focus_manager:
-                console.print(f"[green]✅ ClickEngine has focus manager[/green]")
-            else:
-                console.print(f"[yellow]⚠️ ClickEngine focus manager is None[/yellow]")
-        else:
-            console.print(f"[red]❌ ClickEngine missing focus manager attribute[/red]")
-        
-        console.print(f"\n[green]🎉 Focus management integration test completed![/green]")
-        
         # Test with actual application launch
-        test_with_app = input("\n🚀 Test with actual application launch? (y/n): ").lower().startswith('y')
-        
-        if test_with_app:
-            console.print(f"\n[yellow]📱 Launching application for focus testing...[/yellow]")
-            
-            try:
-                # This will go through the full initialization including app launch
-                element_interactor.interactive_exploration_mode()
-                
-            except KeyboardInterrupt:
-                console.print(f"\n[yellow]⚡ Test interrupted by user[/yellow]")
-            except Exception as e:
-                console.print(f"\n[red]❌ Application test failed: {e}[/red]")
+        if launch is None:
+            launch = sys.stdin.isatty() and _yes("\n🚀 Test with actual application launch? (y/n): ")
+        
+        if launch:
+            _launch_and_explore(element_interactor)
                 
         return True
         
@@ -106,16 +85,87 @@ def test_focus_manager_integration():
         console.print(f"[red]❌ Test failed: {e}[/red]")
         return False
 
-def test_focus_manager_standalone():
+def _check_attributes(element_interactor) -> bool:
+    """Verify the focus manager is wired into the interactor's components"""
+    
+    console = _CONSOLE
+    
+    # Check if focus manager was created
+    if not hasattr(element_interactor, 'window_focus_manager'):
+        console.print(f"[red]❌ WindowFocusManager not found in ElementInteractor[/red]")
+        return False
+    
+    focus_manager = element_interactor.window_focus_manager
+    status_table = Table(title="📊 Focus Manager Status", show_header=False)
+    status_table.add_column("Setting", style="cyan")
+    status_table.add_column("Value")
+    status_table.add_row("Focus verification enabled", str(focus_manager.focus_verification_enabled))
+    status_table.add_row("Auto recovery enabled", str(focus_manager.auto_recovery_enabled))
+    status_table.add_row("Max focus failures", str(focus_manager.max_focus_failures))
+    
+    # Test the focus status method
+    status_table.add_section()
+    for key, value in asdict(focus_manager.get_focus_status_summary()).items():
+        status_table.add_row(key, str(value))
+    
+    # Check other component integrations
+    integration_table = Table(title="🔍 Component Integrations", show_header=False)
+    integration_table.add_column("Component", style="cyan")
+    integration_table.add_column("Status")
+    for component_name, component in (("ScreenshotManager", element_interactor.screenshot_manager),
+                                      ("ClickEngine", element_interactor.click_engine)):
+        integration_table.add_row(component_name, _focus_manager_status(component))
+    
+    console.print("[green]✅ WindowFocusManager initialized successfully[/green]", status_table, integration_table,
+                  "\n[green]🎉 Focus management integration test completed![/green]", sep="\n")
+    return True
+
+def _focus_manager_status(component) -> str:
+    """Markup describing whether a component has a focus manager attribute and whether it is set"""
+    focus_manager = getattr(component, 'focus_manager', _MISSING)
+    if focus_manager is _MISSING:
+        return "[red]❌ missing focus manager attribute[/red]"
+    if focus_manager is None:
+        return "[yellow]⚠️ focus manager is None[/yellow]"
+    return "[green]✅ has focus manager[/green]"
+
+def _launch_and_explore(element_interactor) -> None:
+    """Hand the launched app to interactive exploration for manual focus testing"""
+    
+    console = _CONSOLE
+    console.print(f"\n[yellow]📱 Launching application for focus testing...[/yellow]")
+    
+    try:
+        # This will go through the full initialization including app launch
+        element_interactor.interactive_exploration_mode()
+        
+    except KeyboardInterrupt:
+        console.print(f"\n[yellow]⚡ Test interrupted by user[/yellow]")
+    except Exception as e:
+        console.print(f"\n[red]❌ Application test failed: {e}[/red]")
+
+class _StubConfig:
+    """Config stand-in that answers every lookup with its default"""
+    
+    def get(self, key_path: str, default=None):
+        return default
+
+def test_focus_manager_standalone(real_config: bool = False):
     """Test the focus manager as a standalone component"""
     
-    console = Console()
+    console = _CONSOLE
     
     console.print(f"\n[yellow]🧪 Testing WindowFocusManager standalone...[/yellow]")
     
     try:
-        # Create config
-        config = ConfigManager()
+        from utils.fdom.window_focus_manager import WindowFocusManager
+        
+        # WindowFocusManager only stores the config, so skip loading fdom_config.json unless asked
+        if real_config:
+            from utils.fdom.config_manager import ConfigManager
+            config = ConfigManager()
+        else:
+            config = _StubConfig()
         
         # Create a mock app controller for testing
         class MockAppController:
@@ -130,16 +180,15 @@ def test_focus_manager_standalone():
         console.print(f"[green]✅ WindowFocusManager created successfully[/green]")
         
         # Test configuration
-        console.print(f"[cyan]📊 Configuration:[/cyan]")
-        console.print(f"  - Focus check interval: {focus_manager.focus_check_interval}s")
-        console.print(f"  - Max focus failures: {focus_manager.max_focus_failures}")
-        console.print(f"  - Auto recovery: {focus_manager.auto_recovery_enabled}")
+        console.print(f"[cyan]📊 Configuration:[/cyan]\n"
+                      f"  - Focus check interval: {focus_manager.focus_check_interval}s\n"
+                      f"  - Max focus failures: {focus_manager.max_focus_failures}\n"
+                      f"  - Auto recovery: {focus_manager.auto_recovery_enabled}")
         
         # Test status summary (should handle no app gracefully)
-        status = focus_manager.get_focus_status_summary()
+        status = asdict(focus_manager.get_focus_status_summary())
         console.print(f"\n[cyan]📋 Status with no app:[/cyan]")
-        for key, value in status.items():
-            console.print(f"  - {key}: {value}")
+        console.print("\n".join(f"  - {key}: {value}" for key, value in status.items()))
         
         console.print(f"\n[green]✅ Standalone focus manager test passed[/green]")
         return True
@@ -151,34 +200,36 @@ def test_focus_manager_standalone():
 def main():
     """Main test function"""
     
-    console = Console()
+    parser = argparse.ArgumentParser(description="Window focus management test suite")
+    parser.add_argument("--app-path", help=f"Application executable for the integration test (default: {DEFAULT_APP_PATH})")
+    parser.add_argument("--launch", action=argparse.BooleanOptionalAction, default=None,
+                        help="Launch the app for interactive focus testing (asks when omitted on a terminal)")
+    parser.add_argument("--skip-integration", action="store_true", help="Only run the standalone focus manager test")
+    parser.add_argument("--real-config", action="store_true", help="Load fdom_config.json for the standalone test instead of a stub")
+    args = parser.parse_args()
     
-    console.print(Panel(
-        "[bold green]🔧 Window Focus Management Test Suite[/bold green]\n\n"
-        "This script tests the fixes for window focus issues during exploration.\n"
-        "The fixes include:\n"
-        "• WindowFocusManager with smart focus recovery\n"
-        "• Integration with ScreenshotManager and ClickEngine\n"
-        "• Focus monitoring during deep exploration\n"
-        "• Automatic window focus recovery mechanisms",
-        title="🧪 Focus Fix Verification",
-        border_style="green"
-    ))
+    console = _CONSOLE
+    
+    console.print(_SUITE_PANEL)
     
     # Test 1: Standalone focus manager
     console.print(f"\n[bold yellow]TEST 1: Standalone Focus Manager[/bold yellow]")
-    test1_result = test_focus_manager_standalone()
+    test1_result = test_focus_manager_standalone(args.real_config)
     
     # Test 2: Integration test
-    console.print(f"\n[bold yellow]TEST 2: Integration Test[/bold yellow]")
-    test2_result = test_focus_manager_integration()
+    if args.skip_integration:
+        console.print(f"\n[dim]TEST 2: Integration Test skipped[/dim]")
+        test2_result = None
+    else:
+        console.print(f"\n[bold yellow]TEST 2: Integration Test[/bold yellow]")
+        test2_result = test_focus_manager_integration(args.app_path, args.launch)
     
     # Summary
     console.print(f"\n[bold cyan]📋 TEST SUMMARY[/bold cyan]")
     console.print(f"  • Standalone test: {'✅ PASS' if test1_result else '❌ FAIL'}")
-    console.print(f"  • Integration test: {'✅ PASS' if test2_result else '❌ FAIL'}")
+    console.print(f"  • Integration test: {'⏭️ SKIPPED' if test2_result is None else '✅ PASS' if test2_result else '❌ FAIL'}")
     
-    if test1_result and test2_result:
+    if test1_result and test2_result is not False:
         console.print(f"\n[bold green]🎉 All tests passed! Focus management fixes are working.[/bold green]")
         console.print(f"\n[cyan]💡 You can now run enhanced_auto_explore.py and it should:[/cyan]")
         console.print(f"  • Keep the target window focused during exploration")
@@ -189,4 +240,6 @@ def main():
         console.print(f"\n[bold red]❌ Some tests failed. Please check the implementation.[/bold red]")
 
 if __name__ == "__main__":
+    # Add project root to path; importing this module leaves sys.path alone
+    sys.path.insert(0, str(Path(__file__).parent))
     main() 
\ No newline at end of file
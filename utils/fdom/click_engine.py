@@ -18,6 +18,7 @@ class ClickEngine:
         self.console = Console()
         self.screenshot_manager = ScreenshotManager(app_controller, visual_differ)
         self.focus_manager = focus_manager
+        self._before_pixels_hash: Optional[bytes] = None
         
     def execute_click_with_centroids(self, node_data: Dict, window_pos: Dict, 
                                    source_element_name: str) -> ClickResult:
@@ -75,6 +76,8 @@ class ClickEngine:
             return ClickResult(success=False, state_changed=False, error_message="Could not take before screenshot")
         
         before_hash = self.visual_differ.calculate_image_hash(before_screenshot)
+        # Raw-pixel digest for the cheap "nothing changed" check after each click
+        self._before_pixels_hash = self.screenshot_manager.capture_window_hash()
         
         # Try each centroid
         wait_times = [2, 2, 2]
@@ -194,6 +197,12 @@ class ClickEngine:
             self.console.print(f"[yellow]⏱️ Waiting {wait_time}s for UI response...[/yellow]")
             time.sleep(wait_time)
             
+            # Identical pixels: skip saving, re-hashing and diffing the after screenshot
+            if (self._before_pixels_hash is not None and
+                    self.screenshot_manager.capture_window_hash() == self._before_pixels_hash):
+                self.console.print(f"[yellow]⚠️ No change detected with {label} (pixels identical)[/yellow]")
+                return False
+            
             # Check for change
             after_screenshot = self.screenshot_manager.take_screenshot(f"after_{label}_wait_{wait_time}s")
             if not after_screenshot:
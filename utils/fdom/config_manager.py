@@ -17,6 +17,9 @@ class ConfigManager:
     Handles loading, validation, and testing of all configuration settings
     """
     
+    # Default-path instance shared by framework modules (see shared())
+    _shared_instance: Optional["ConfigManager"] = None
+    
     def __init__(self, config_path: Optional[str] = None):
         """
         Initialize ConfigManager with automatic config loading
@@ -28,6 +31,18 @@ class ConfigManager:
         self.config_path = config_path or self._get_default_config_path()
         self.config = self._load_and_validate_config()
         
+    @classmethod
+    def shared(cls) -> "ConfigManager":
+        """
+        Get the process-wide ConfigManager for the default config file
+        
+        Parsed on first use and reused afterwards, so constructing several
+        framework modules doesn't reload and revalidate fdom_config.json each time.
+        """
+        if cls._shared_instance is None:
+            cls._shared_instance = cls()
+        return cls._shared_instance
+    
     def _get_default_config_path(self) -> str:
         """Get default config file path relative to this module"""
         current_dir = Path(__file__).parent
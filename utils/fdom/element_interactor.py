@@ -1,6 +1,7 @@
 """ElementInteractor - Core exploration engine for fDOM Framework
 Implements sophisticated click → detect → navigate strategy
 """
+import atexit
 import json
 import os
 import sys
@@ -38,7 +39,8 @@ from utils.fdom.visual_differ import VisualDiffer
 from utils.fdom.interaction_types import ClickResult, BacktrackStrategy
 from utils.fdom.interaction_utils import (
     sanitize_app_name, 
-    sanitize_node_id_for_files
+    sanitize_node_id_for_files,
+    MANUAL_CLICK_READY_SENTINEL
 )
 from utils.fdom.interactive_cli import InteractiveCLI
 from utils.fdom.screenshot_manager import ScreenshotManager
@@ -60,7 +62,7 @@ class ElementInteractor:
         self.app_executable_path = app_executable_path
         
         # Initialize framework components
-        self.config = ConfigManager()
+        self.config = ConfigManager.shared()
         self.screen_manager = ScreenManager(self.config)
         
         # ✅ LOAD TEMPLATE FILE CONFIG
@@ -118,6 +120,7 @@ class ElementInteractor:
         
         # Initialize modular components
         self.window_focus_manager = WindowFocusManager(self.app_controller, self.config)
+        atexit.register(self.window_focus_manager.close)
         self.interactive_cli = InteractiveCLI(self)
         self.screenshot_manager = ScreenshotManager(self.app_controller, self.visual_differ, debug_mode=True, focus_manager=self.window_focus_manager)
         self.state_processor = StateProcessor(self.state_manager, self.seraphine_integrator, self.visual_differ)
@@ -133,6 +136,21 @@ class ElementInteractor:
         self.screenshot_stack = []
         self.debug_mode = True
         
+        # Bare node id -> node across all states, rebuilt when states are added/reloaded
+        self._bare_node_index: Dict[str, Dict] = {}
+        self._bare_node_index_key: Optional[Tuple[int, int]] = None
+        
+        # (window pixels hash, node id) -> outcome of clicks that changed nothing,
+        # persisted per app so re-runs skip re-clicking them on an identical screen
+        self._interaction_memo: Optional[Dict[str, str]] = None
+        if self.config.get("interaction.memoize_non_interactive", False):
+            self._interaction_memo = self._load_interaction_memo()
+            atexit.register(self._flush_interaction_memo)
+        
+        # Set by chain(): non-interactive marks skip the per-click fdom.json write
+        self._defer_fdom_save = False
+        self._fdom_save_pending = False
+        
         self.console.print(Panel(
             f"[bold]🎯 ElementInteractor Ready[/bold]\n\n"
             f"🎮 Strategy: Depth-first exploration\n"
@@ -237,9 +255,22 @@ class ElementInteractor:
         if not node_data.get('g_enabled', True):
             self.console.print(f"[yellow]⚠️ Element '{node_data.get('g_icon_name', 'unknown')}' is disabled - marking as non-interactive[/yellow]")
             self.state_manager.mark_node_explored(node_id, click_result=None, interaction_type="disabled")
-            self.state_manager.save_fdom_to_file()
+            self._save_fdom()
             return ClickResult(success=True, state_changed=False, interaction_type="disabled")
         
+        # Same element on a pixel-identical screen already did nothing in an earlier run
+        memo_key = None
+        if self._interaction_memo is not None:
+            pixels_hash = self.capture_screenshot_hash()
+            if pixels_hash is not None:
+                memo_key = f"{pixels_hash.hex()}|{node_id}"
+                if memo_key in self._interaction_memo:
+                    interaction_type = self._interaction_memo[memo_key]
+                    self.console.print(f"[dim]♻️ Memoized {interaction_type}: {node_data.get('g_icon_name', 'unknown')}[/dim]")
+                    self.state_manager.mark_node_explored(node_id, click_result=None, interaction_type=interaction_type)
+                    self._save_fdom()
+                    return ClickResult(success=True, state_changed=False, interaction_type=interaction_type)
+        
         window_pos = self._get_current_window_position()
         if not window_pos:
             return ClickResult(success=False, state_changed=False, error_message="Could not get window position")
@@ -276,6 +307,9 @@ class ElementInteractor:
             diff_filename = f"{self.current_state_id}_to_processing_via_{safe_node_id}.png"
             diff_path = str(diffs_dir / diff_filename)
             
+            # Small WebP copy of the new state's full window for reports and diffing
+            thumbnail = self.screenshot_manager.save_thumbnail(click_result.after_screenshot)
+            
             # ✅ DELEGATE TO STATE PROCESSOR - PASS PERFECT DIFF_RESULT
             new_state_name = self.state_processor.process_successful_click(
                 node_id,                        # node_id: str
@@ -284,7 +318,8 @@ class ElementInteractor:
                 before_screenshot,             # before_screenshot: str
                 click_result.after_screenshot, # after_screenshot: str
                 diff_path,                     # diff_path: str
-                click_result.diff_result       # ✅ NEW: Pass perfect diff_result from ClickEngine
+                click_result.diff_result,      # ✅ NEW: Pass perfect diff_result from ClickEngine
+                thumbnail                      # thumbnail_path: stored on the state before its save
             )
             
             if new_state_name:
@@ -335,12 +370,98 @@ class ElementInteractor:
         elif click_result.success and not click_result.state_changed:
             # Non-interactive element
             self.state_manager.mark_node_explored(node_id, click_result=None, interaction_type="non_interactive")
-            self.state_manager.save_fdom_to_file()
+            self._save_fdom()
+            if memo_key:
+                self._interaction_memo[memo_key] = "non_interactive"
+                self._interaction_memo_dirty = True
             return click_result
         else:
             # Click execution failed
             return click_result
 
+    def chain(self, node_ids: List[str], inter_click_wait: float = 0.2) -> List[ClickResult]:
+        """
+        Click several nodes back to back, writing fdom.json once for the batch
+        
+        Each click still does its own before/after capture and diff: it
+        auto-backtracks after a state change, so attribution stays per click.
+        The batch shares the fdom.json writes for non-interactive and disabled
+        elements. A click that raises yields a failed result, and the batch
+        carries on with the next node.
+        """
+        results = []
+        self._defer_fdom_save = True
+        try:
+            for index, node_id in enumerate(node_ids):
+                if index:
+                    time.sleep(inter_click_wait)
+                try:
+                    result = self.click_element(node_id)
+                except Exception as e:
+                    result = ClickResult(success=False, state_changed=False, error_message=str(e))
+                # The app-not-running early exit returns a plain dict
+                results.append(ClickResult(**result) if isinstance(result, dict) else result)
+        finally:
+            self._defer_fdom_save = False
+            if self._fdom_save_pending:
+                self._fdom_save_pending = False
+                self.state_manager.save_fdom_to_file()
+        return results
+
+    def _interaction_memo_path(self) -> Path:
+        return Path(__file__).parent.parent.parent / "apps" / self.app_name / "interaction_memo.json"
+
+    def _load_interaction_memo(self) -> Dict[str, str]:
+        """Load memoized no-op interactions from earlier runs of this app"""
+        self._interaction_memo_dirty = False
+        memo_path = self._interaction_memo_path()
+        if not memo_path.exists():
+            return {}
+        try:
+            with open(memo_path, 'r', encoding='utf-8') as f:
+                memo = json.load(f)
+            self.console.print(f"[green]♻️ Loaded {len(memo)} memoized interactions[/green]")
+            return memo
+        except (OSError, ValueError) as e:
+            self.console.print(f"[yellow]⚠️ Could not load interaction memo: {e}[/yellow]")
+            return {}
+
+    def _flush_interaction_memo(self) -> None:
+        """Write the interaction memo back to disk if it gained entries (runs at exit)"""
+        if not self._interaction_memo_dirty:
+            return
+        try:
+            memo_path = self._interaction_memo_path()
+            memo_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(memo_path, 'w', encoding='utf-8') as f:
+                json.dump(self._interaction_memo, f)
+            self._interaction_memo_dirty = False
+        except OSError as e:
+            self.console.print(f"[yellow]⚠️ Could not save interaction memo: {e}[/yellow]")
+
+    def _save_fdom(self) -> None:
+        """Write fdom.json now, or once at the end of the current chain()"""
+        if self._defer_fdom_save:
+            self._fdom_save_pending = True
+        else:
+            self.state_manager.save_fdom_to_file()
+
+    def capture_screenshot_hash(self) -> Optional[bytes]:
+        """Cheap readiness probe: hash of the current window pixels (None if unavailable)"""
+        return self.screenshot_manager.capture_window_hash()
+
+    def wait_for_idle(self, max_s: float = 1.5, poll_s: float = 0.05) -> bool:
+        """Wait until two consecutive window captures match, at most max_s seconds; False on timeout"""
+        deadline = time.monotonic() + max_s
+        last_hash = self.capture_screenshot_hash()
+        while time.monotonic() < deadline:
+            time.sleep(poll_s)
+            current_hash = self.capture_screenshot_hash()
+            if current_hash is not None and current_hash == last_hash:
+                return True
+            last_hash = current_hash
+        return False
+
     def navigate_back_to_state(self, target_state_id: str, failure_reference_screenshot: str = None) -> bool:
         """CLEANED: Delegate to NavigationEngine"""
         return self.navigation_engine.navigate_back_to_state(target_state_id, failure_reference_screenshot)
@@ -357,12 +478,17 @@ class ElementInteractor:
             state_data = self.state_manager.fdom_data.get("states", {}).get(state_name, {})
             return state_data.get("nodes", {}).get(actual_node_id)
         
-        # OLD FORMAT: search all states (fallback)
-        for state_data in self.state_manager.fdom_data.get("states", {}).values():
-            nodes = state_data.get("nodes", {})
-            if node_id in nodes:
-                return nodes[node_id]
-        return None
+        # OLD FORMAT: bare node id, resolved through an index over all states
+        states = self.state_manager.fdom_data.get("states", {})
+        index_key = (id(states), len(states))
+        if self._bare_node_index_key != index_key:
+            # States are only ever added (or the whole fDOM reloaded), so this key is enough
+            self._bare_node_index = {}
+            for state_data in states.values():
+                for bare_id, node in state_data.get("nodes", {}).items():
+                    self._bare_node_index.setdefault(bare_id, node)
+            self._bare_node_index_key = index_key
+        return self._bare_node_index.get(node_id)
 
     def _get_current_window_position(self) -> Optional[Dict]:
         """Get current app window position on screen"""
@@ -764,6 +890,10 @@ class ElementInteractor:
                 table.add_row(str(idx), state_id, f"{indent}{node_id}", icon_name, brief, node_type)
             self.console.print(table)
 
+            # Let piped drivers (auto_explore.py) know we're waiting for input
+            if not sys.stdin.isatty():
+                print(MANUAL_CLICK_READY_SENTINEL, flush=True)
+
             try:
                 idx = IntPrompt.ask("Enter index to click (or blank to exit)", default=None)
             except Exception:
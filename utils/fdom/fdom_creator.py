@@ -27,7 +27,7 @@ class FDOMCreator:
         self.console = Console()
         
         # SINGLE config load point
-        self.config_manager = ConfigManager()  # Loads fdom_config.json
+        self.config_manager = ConfigManager.shared()  # Loads fdom_config.json
         self.config = self.config_manager.config  # Direct access to all settings
         
         # Pass config to ALL modules
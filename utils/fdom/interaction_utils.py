@@ -30,3 +30,8 @@ def sanitize_app_name(app_name: str) -> str:
 def sanitize_node_id_for_files(node_id: str) -> str:
     """Convert node ID to file-safe format"""
     return node_id.replace("::", "__").replace(":", "_").replace("/", "_").replace("\\", "_")
+
+
+# Printed on its own line by manual-click mode whenever it is ready for the
+# next index, so scripted drivers can wait for it instead of sleeping
+MANUAL_CLICK_READY_SENTINEL = "READY>"
@@ -1,13 +1,18 @@
 """Screenshot capture and management"""
+import hashlib
 import os
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional
 from rich.console import Console
 from PIL import Image
 import mss
 
+# Downscaled lossy copies kept next to full PNGs for state records and diffs
+THUMBNAIL_SIZE = (1280, 720)
+THUMBNAIL_QUALITY = 80
+
 
 class ScreenshotManager:
     """Handles screenshot capture, storage, and cleanup"""
@@ -36,25 +41,11 @@ class ScreenshotManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             custom_filename = f"interaction_{timestamp}_{suffix}.png"
             
-            # Get window info
-            window_id = self.app_controller.current_app_info["window_id"]
-            window_info = self.app_controller.gui_api.get_window_info(window_id)
-            
-            if not window_info:
+            window_bbox = self._get_window_bbox()
+            if not window_bbox:
                 self.console.print("[yellow]🔄 Window lookup failed for screenshot[/yellow]")
                 return None
             
-            # Create bounding box for just the window
-            pos = window_info['window_data']['position']
-            size = window_info['window_data']['size']
-            
-            window_bbox = {
-                'left': pos['x'],
-                'top': pos['y'], 
-                'width': size['width'],
-                'height': size['height']
-            }
-            
             # Capture window area only using mss
             with mss.mss() as sct:
                 window_screenshot = sct.grab(window_bbox)
@@ -72,6 +63,51 @@ class ScreenshotManager:
             self.console.print(f"[red]❌ Screenshot capture failed: {e}[/red]")
             return None
     
+    def capture_window_hash(self) -> Optional[bytes]:
+        """SHA-256 of the app window's raw pixels, captured without saving or refocusing"""
+        try:
+            if not self.app_controller or not self.app_controller.current_app_info:
+                return None
+            
+            window_bbox = self._get_window_bbox()
+            if not window_bbox:
+                return None
+            
+            with mss.mss() as sct:
+                return hashlib.sha256(sct.grab(window_bbox).bgra).digest()
+            
+        except Exception:
+            return None
+    
+    def save_thumbnail(self, screenshot_path: str) -> Optional[str]:
+        """Save a downscaled WebP copy next to a screenshot and return its path"""
+        try:
+            thumbnail_path = Path(screenshot_path).with_suffix(".webp")
+            with Image.open(screenshot_path) as img:
+                img.thumbnail(THUMBNAIL_SIZE)
+                img.save(thumbnail_path, "WEBP", quality=THUMBNAIL_QUALITY, method=4)
+            return str(thumbnail_path)
+            
+        except Exception as e:
+            self.console.print(f"[yellow]⚠️ Thumbnail failed for {os.path.basename(screenshot_path)}: {e}[/yellow]")
+            return None
+    
+    def _get_window_bbox(self) -> Optional[Dict]:
+        """Current bounding box of the app window in mss format"""
+        window_id = self.app_controller.current_app_info["window_id"]
+        window_info = self.app_controller.gui_api.get_window_info(window_id)
+        if not window_info:
+            return None
+        
+        pos = window_info['window_data']['position']
+        size = window_info['window_data']['size']
+        return {
+            'left': pos['x'],
+            'top': pos['y'], 
+            'width': size['width'],
+            'height': size['height']
+        }
+    
     def cleanup_screenshot(self, screenshot_path: str) -> None:
         """Delete a single screenshot file - skip in debug mode"""
         if self.debug_mode:
@@ -30,7 +30,7 @@ class SeraphineIntegrator:
     def __init__(self, app_name: str):
         self.app_name = app_name
         self.console = Console()
-        self.config_manager = ConfigManager()
+        self.config_manager = ConfigManager.shared()
         self.config = self.config_manager.config
         
         # FIXED: Setup paths to point to root-level apps directory
@@ -7,6 +7,7 @@ import os
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Set
 from dataclasses import dataclass
+from collections import deque
 from datetime import datetime
 import networkx as nx
 from rich.console import Console
@@ -83,7 +84,7 @@ class StateManager:
     
     def __init__(self, app_name: str):
         self.app_name = app_name
-        self.config = ConfigManager()
+        self.config = ConfigManager.shared()
         self.console = Console()
         self.seraphine = SeraphineIntegrator(app_name)
         
@@ -109,6 +110,9 @@ class StateManager:
         self.explored_nodes: Set[str] = set()
         self.non_interactive_nodes: Set[str] = set()
         
+        # FIFO view of pending_nodes for pop_next_pending(); stale entries are skipped lazily
+        self._pending_queue: deque = deque()
+        
         self.console.print(f"[green]🧠 StateManager initialized for: {app_name}[/green]")
     
     def create_initial_fdom_state(self, screenshot_path: str) -> Dict:
@@ -192,6 +196,27 @@ class StateManager:
         # For now, return first pending node (can implement smarter strategies later)
         return next(iter(self.pending_nodes))
     
+    def pop_next_pending(self) -> Optional[str]:
+        """
+        Hand out pending nodes one at a time in O(1) amortized
+        
+        The node stays in pending_nodes until it is marked explored. A node that
+        is still pending after its click comes round again once every other
+        pending node has been handed out.
+        
+        Returns:
+            Node ID to explore next, or None if all explored
+        """
+        while True:
+            if not self._pending_queue:
+                if not self.pending_nodes:
+                    return None
+                # Refill from the set; also picks up nodes added since the last refill
+                self._pending_queue.extend(self.pending_nodes)
+            node_id = self._pending_queue.popleft()
+            if node_id in self.pending_nodes:
+                return node_id
+    
     def mark_node_explored(self, node_id: str, click_result: Optional[str] = None, 
                           interaction_type: Optional[str] = None) -> None:
         """
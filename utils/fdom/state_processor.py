@@ -18,7 +18,8 @@ class StateProcessor:
     def process_successful_click(self, node_id: str, source_element_name: str, 
                             current_state: str, before_screenshot: str, 
                             after_screenshot: str, diff_path: str, 
-                            perfect_diff_result: Dict = None) -> Optional[str]:
+                            perfect_diff_result: Dict = None,
+                            thumbnail_path: Optional[str] = None) -> Optional[str]:
         """Process a successful click that caused state change - REUSE PERFECT CROP"""
         
         # Generate semantic state name
@@ -55,7 +56,7 @@ class StateProcessor:
         # Create new state data
         new_state_data = self._create_semantic_state_data(
             new_state_name, seraphine_result, diff_path,
-            source_element_name, node_id, current_state
+            source_element_name, node_id, current_state, thumbnail_path
         )
         
         # Add elements with coordinate mapping and deduplication
@@ -100,11 +101,12 @@ class StateProcessor:
     
     def _create_semantic_state_data(self, state_name: str, seraphine_result: Dict, 
                                    diff_path: str, source_element: str, 
-                                   trigger_node: str, parent_state: str) -> Dict:
+                                   trigger_node: str, parent_state: str,
+                                   thumbnail_path: Optional[str] = None) -> Dict:
         """Create state with semantic metadata"""
         display_breadcrumb = state_name.replace('_', '>')
         
-        return {
+        state_data = {
             "id": state_name,
             "parent": parent_state,
             "trigger_node": trigger_node,
@@ -116,6 +118,9 @@ class StateProcessor:
             "total_elements": len(seraphine_result['nodes']),
             "nodes": {}
         }
+        if thumbnail_path:
+            state_data["thumbnail"] = thumbnail_path
+        return state_data
     
     def _is_duplicate_element(self, node_data: Dict, current_state: str) -> bool:
         """ENHANCED: Check if element is duplicate with stronger logic"""
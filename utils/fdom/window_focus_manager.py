@@ -3,10 +3,88 @@ Window Focus Manager - Ensures target window stays focused during exploration
 Handles focus loss recovery and prevents clicks on wrong windows
 """
 
+import json
+import threading
 import time
-from typing import Optional, Dict, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Dict, List, Tuple
 from rich.console import Console
 
+try:
+    import win32gui
+except ImportError:
+    win32gui = None
+
+try:
+    import ctypes
+    from ctypes import wintypes
+    _user32 = ctypes.windll.user32
+    _kernel32 = ctypes.windll.kernel32
+    WinEventProcType = ctypes.WINFUNCTYPE(
+        None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND,
+        wintypes.LONG, wintypes.LONG, wintypes.DWORD, wintypes.DWORD
+    )
+    _user32.SetWinEventHook.restype = wintypes.HANDLE
+    _user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
+    _user32.GetWindowThreadProcessId.restype = wintypes.DWORD
+except (ImportError, AttributeError):
+    # Not on Windows - fall back to polling GetForegroundWindow
+    _user32 = None
+
+# winuser.h
+EVENT_SYSTEM_FOREGROUND = 0x0003
+EVENT_SYSTEM_MOVESIZEEND = 0x000B
+EVENT_OBJECT_LOCATIONCHANGE = 0x800B
+OBJID_WINDOW = 0
+CHILDID_SELF = 0
+WINEVENT_OUTOFCONTEXT = 0x0000
+WM_QUIT = 0x0012
+
+# Foreground must come first: without it the hook thread is not worth running.
+# Foreground is hooked system-wide (other apps taking focus is the point); the rest only for the target
+# process, which keeps LOCATIONCHANGE (programmatic moves, maximize/restore) from flooding the callback
+HOOKED_EVENTS = (EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_MOVESIZEEND, EVENT_OBJECT_LOCATIONCHANGE)
+
+# Seconds a polled GetForegroundWindow result is reused when the hook is unavailable
+FOREGROUND_TTL = 0.05
+
+# Focus recovery methods (name -> WindowFocusManager method), in default trial order
+FOCUS_METHODS = {
+    "smart_foreground": "_focus_via_smart_foreground",
+    "focus_window": "_focus_via_focus_command",
+    "title_bar_click": "_focus_via_title_bar_click",
+}
+
+# Upper bound for the backed-off interval between unforced focus checks
+MAX_CHECK_INTERVAL = 60.0
+
+# Seconds a successful focus verification covers follow-up prepare_* calls
+RECENTLY_VERIFIED = 0.25
+
+# Pixels of drift still treated as "window did not move"
+POSITION_TOLERANCE = 1
+
+# Seconds a get_window_info result is reused within one recovery cycle
+WINDOW_INFO_TTL = 1.0
+
+@dataclass(slots=True)
+class FocusStatus:
+    """Snapshot of focus management state (updated in place, use dataclasses.asdict for a dict)"""
+    focus_verification_enabled: bool
+    auto_recovery_enabled: bool
+    focus_failure_count: int
+    max_focus_failures: int
+    expected_window_id: Optional[str]
+    last_known_position: Optional[Dict]
+
+# Shared by every manager instance so terminal detection runs once
+_CONSOLE = Console()
+
+# Single worker keeps log lines in order while focus checks never block on terminal I/O
+_LOG_WRITER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="focus-log")
+
 class WindowFocusManager:
     """
     Manages window focus to prevent exploration from switching to other windows
@@ -15,13 +93,17 @@ class WindowFocusManager:
     def __init__(self, app_controller, config):
         self.app_controller = app_controller
         self.config = config
-        self.console = Console()
+        self.console = _CONSOLE
         
         # Focus management settings
         self.focus_verification_enabled = True
         self.auto_recovery_enabled = True
         self.focus_check_interval = 3  # seconds between focus checks
         self.last_focus_check = 0
+        
+        # Grows while consecutive checks find the window still in front, reset by prepare_*
+        self._current_check_interval = self.focus_check_interval
+        self._consecutive_stable = 0
         self.focus_failure_count = 0
         self.max_focus_failures = 3
         
@@ -30,6 +112,134 @@ class WindowFocusManager:
         self.expected_window_title = None
         self.last_known_position = None
         
+        # Reused by get_focus_status_summary instead of building a dict per call
+        self._status = FocusStatus(self.focus_verification_enabled, self.auto_recovery_enabled,
+                                   self.focus_failure_count, self.max_focus_failures, None, None)
+        
+        # Only one focus recovery at a time; concurrent callers reuse its result
+        self._recovery_lock = threading.Lock()
+        self._last_recovery_result = False
+        
+        # app_name -> {recovery method: successes}, persisted per app as focus_methods.json
+        self._method_success: Dict[str, Dict[str, int]] = {}
+        
+        # window_id -> (monotonic stamp, get_window_info result), dropped when the window moves
+        self._window_info_cache: Dict[str, Tuple[float, Dict]] = {}
+        
+        # window_id -> hwnd, stable for the window's lifetime; dropped on failure or move
+        self._hwnd_by_window_id: Dict[str, int] = {}
+        
+        # Foreground window as reported by the EVENT_SYSTEM_FOREGROUND hook
+        self._current_foreground_hwnd = None
+        self._foreground_hooked = False
+        self._hook_thread_id = None
+        self._hooked_pid = None
+        self._fg_changed = threading.Event()
+        
+        # Focus checks report success until this monotonic time (see expect_focus_change)
+        self._expect_focus_change_until = 0.0
+        
+        # When focus was last confirmed; lets back-to-back prepare_* calls skip the check
+        self._last_verified_monotonic = 0.0
+        
+        # (monotonic stamp, hwnd) of the last polled GetForegroundWindow when unhooked
+        self._fg_cache = (0.0, None)
+        self._get_foreground = win32gui.GetForegroundWindow if win32gui else None
+        
+    def _ensure_win_event_hooks(self, hwnd: int) -> None:
+        """Track foreground and geometry changes of hwnd's process via SetWinEventHook on a message-pumping daemon thread"""
+        if _user32 is None:
+            return
+        
+        pid = wintypes.DWORD()
+        _user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+        if not pid.value or pid.value == self._hooked_pid:
+            return
+        
+        # Target process changed (or first resolve): replace the hooks scoped to the old one
+        self.close()
+        self._hooked_pid = pid.value
+        ready = threading.Event()
+        threading.Thread(target=self._run_win_event_hooks, args=(pid.value, ready),
+                         name="focus-hook", daemon=True).start()
+        # Wait until the hooks are installed (or failed) so the next check sees them
+        ready.wait(timeout=1.0)
+    
+    def _run_win_event_hooks(self, pid: int, ready: threading.Event) -> None:
+        """Install the WinEvent hooks and pump messages so their callback gets delivered"""
+        hooks = []
+        thread_id = _kernel32.GetCurrentThreadId()
+        try:
+            # Keep a reference to the callback for as long as the hooks live
+            self._win_event_proc = WinEventProcType(self._on_win_event)
+            for event in HOOKED_EVENTS:
+                process = 0 if event == EVENT_SYSTEM_FOREGROUND else pid
+                hook = _user32.SetWinEventHook(event, event, 0, self._win_event_proc, process, 0, WINEVENT_OUTOFCONTEXT)
+                if hook:
+                    hooks.append(hook)
+                elif event == EVENT_SYSTEM_FOREGROUND:
+                    break
+            else:
+                self._hook_thread_id = thread_id
+                self._current_foreground_hwnd = _user32.GetForegroundWindow()
+                self._foreground_hooked = True
+        finally:
+            ready.set()
+        
+        msg = wintypes.MSG()
+        try:
+            while hooks and _user32.GetMessageW(ctypes.byref(msg), 0, 0, 0) > 0:
+                _user32.TranslateMessage(ctypes.byref(msg))
+                _user32.DispatchMessageW(ctypes.byref(msg))
+        finally:
+            # A replacement hook thread may already be live; only clear state that is still ours
+            if self._hook_thread_id in (None, thread_id):
+                self._hook_thread_id = None
+                self._foreground_hooked = False
+            for hook in hooks:
+                _user32.UnhookWinEvent(hook)
+    
+    def _on_win_event(self, hook, event, hwnd, id_object, id_child, event_thread, event_time) -> None:
+        """WinEvent callback - must stay tiny, Windows drops hooks that block"""
+        if event == EVENT_SYSTEM_FOREGROUND:
+            self._current_foreground_hwnd = hwnd
+            self._fg_changed.set()
+        elif id_object == OBJID_WINDOW and id_child == CHILDID_SELF:
+            # Moved or resized top-level window: forget its cached info
+            for window_id, (_, window_info) in list(self._window_info_cache.items()):
+                if window_info.get('window_data', {}).get('hwnd') == hwnd:
+                    self._window_info_cache.pop(window_id, None)
+            # ...and re-resolve it on the next check so tracking picks up the new geometry
+            for window_id, known_hwnd in list(self._hwnd_by_window_id.items()):
+                if known_hwnd == hwnd:
+                    self._hwnd_by_window_id.pop(window_id, None)
+    
+    def _get_window_info_cached(self, window_id: str, refresh: bool = False) -> Optional[Dict]:
+        """gui_api.get_window_info, reused for WINDOW_INFO_TTL unless the window moved"""
+        now = time.monotonic()
+        cached = self._window_info_cache.get(window_id)
+        if not refresh and cached and now - cached[0] < WINDOW_INFO_TTL:
+            return cached[1]
+        
+        window_info = self.app_controller.gui_api.get_window_info(window_id)
+        if window_info:
+            self._window_info_cache[window_id] = (now, window_info)
+        else:
+            self._window_info_cache.pop(window_id, None)
+        return window_info
+    
+    def close(self) -> None:
+        """Stop the WinEvent hook thread (hooks are reinstalled on the next window resolve)"""
+        if self._hook_thread_id:
+            _user32.PostThreadMessageW(self._hook_thread_id, WM_QUIT, 0, 0)
+            self._hook_thread_id = None
+        self._foreground_hooked = False
+        self._hooked_pid = None
+        
+    def _log(self, message: str) -> None:
+        """Print via the background log writer"""
+        _LOG_WRITER.submit(self.console.print, message)
+    
     def ensure_target_window_focused(self, force_check: bool = False) -> bool:
         """
         Ensure the target application window has focus
@@ -44,134 +254,255 @@ class WindowFocusManager:
         # Skip if focus verification is disabled
         if not self.focus_verification_enabled:
             return True
+        
+        # Caller announced a deliberate focus transfer (e.g. opening a file dialog)
+        if time.monotonic() < self._expect_focus_change_until:
+            return True
             
         # Time-based focus checks (unless forced)
         current_time = time.time()
-        if not force_check and (current_time - self.last_focus_check) < self.focus_check_interval:
+        if not force_check and (current_time - self.last_focus_check) < self._current_check_interval:
             return True
             
         self.last_focus_check = current_time
         
         try:
             if not self.app_controller.current_app_info:
-                self.console.print("[red]❌ No app info available for focus check[/red]")
+                self._log("[red]❌ No app info available for focus check[/red]")
                 return False
             
             window_id = self.app_controller.current_app_info['window_id']
             self.expected_window_id = window_id
             
-            # Step 1: Verify window still exists
-            window_info = self.app_controller.gui_api.get_window_info(window_id)
-            if not window_info:
-                self.console.print(f"[red]❌ Target window {window_id} no longer exists[/red]")
-                return self._handle_focus_failure("window_not_found")
+            # Step 1: Resolve the window, verifying it still exists unless its hwnd is known
+            hwnd = self._hwnd_by_window_id.get(window_id)
+            window_info = None
+            if hwnd is not None and win32gui and not win32gui.IsWindow(hwnd):
+                # Destroyed since it was cached: the full lookup below refreshes or reports it
+                self._hwnd_by_window_id.pop(window_id, None)
+                hwnd = None
+            if hwnd is None:
+                window_info = self._get_window_info_cached(window_id, refresh=True)
+                if not window_info:
+                    self._log(f"[red]❌ Target window {window_id} no longer exists[/red]")
+                    return self._handle_focus_failure("window_not_found")
+                hwnd = window_info['window_data']['hwnd']
+                self._hwnd_by_window_id[window_id] = hwnd
+                self._ensure_win_event_hooks(hwnd)
             
             # Step 2: Check if window is focused/foreground
-            hwnd = window_info['window_data']['hwnd']
             is_foreground = self._is_window_foreground(hwnd)
             
             if is_foreground:
-                self.console.print(f"[green]✅ Target window is in foreground[/green]")
+                self._log(f"[green]✅ Target window is in foreground[/green]")
                 self.focus_failure_count = 0  # Reset failure count
-                self._update_window_state_tracking(window_info)
+                self._last_verified_monotonic = time.monotonic()
+                self._consecutive_stable += 1
+                self._current_check_interval = min(MAX_CHECK_INTERVAL,
+                                                   self.focus_check_interval * (1.5 ** self._consecutive_stable))
+                if window_info:
+                    self._update_window_state_tracking(window_info)
                 return True
             else:
-                self.console.print(f"[yellow]⚠️ Target window lost focus - attempting recovery[/yellow]")
+                self._log(f"[yellow]⚠️ Target window lost focus - attempting recovery[/yellow]")
                 return self._recover_window_focus(hwnd, window_id)
                 
         except Exception as e:
-            self.console.print(f"[red]❌ Focus check failed: {e}[/red]")
+            self._log(f"[red]❌ Focus check failed: {e}[/red]")
             return self._handle_focus_failure("check_exception", str(e))
     
+    @staticmethod
+    def _owns_foreground(foreground_hwnd: Optional[int], hwnd: int) -> bool:
+        """True if the foreground window is hwnd or another window of its GUI thread (e.g. an owned dialog)"""
+        if foreground_hwnd == hwnd:
+            return True
+        if not foreground_hwnd or _user32 is None:
+            return False
+        target_thread = _user32.GetWindowThreadProcessId(hwnd, None)
+        return target_thread != 0 and _user32.GetWindowThreadProcessId(foreground_hwnd, None) == target_thread
+    
     def _is_window_foreground(self, hwnd: int) -> bool:
-        """Check if the window is currently in the foreground"""
+        """Check if the window (or one of its thread's dialogs) is currently in the foreground"""
+        # The hook keeps the foreground hwnd current, so no GetForegroundWindow is needed
+        if self._foreground_hooked:
+            return self._owns_foreground(self._current_foreground_hwnd, hwnd)
+        
+        # Polling fallback: adjacent checks within FOREGROUND_TTL share one syscall
+        now = time.monotonic()
+        if now - self._fg_cache[0] < FOREGROUND_TTL:
+            return self._owns_foreground(self._fg_cache[1], hwnd)
+        
         try:
-            import win32gui
-            foreground_hwnd = win32gui.GetForegroundWindow()
-            return foreground_hwnd == hwnd
+            foreground_hwnd = self._get_foreground()
+            self._fg_cache = (now, foreground_hwnd)
+            return self._owns_foreground(foreground_hwnd, hwnd)
         except Exception as e:
-            self.console.print(f"[yellow]⚠️ Could not check foreground window: {e}[/yellow]")
+            self._log(f"[yellow]⚠️ Could not check foreground window: {e}[/yellow]")
             return False
     
+    def _wait_for_foreground(self, hwnd: int, timeout: float) -> bool:
+        """Wait until hwnd is foreground, returning as soon as the hook reports it"""
+        if not self._foreground_hooked:
+            time.sleep(timeout)
+            return self._is_window_foreground(hwnd)
+        
+        deadline = time.monotonic() + timeout
+        while not self._owns_foreground(self._current_foreground_hwnd, hwnd):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._fg_changed.clear()
+            # Re-check after clearing so a change in between isn't missed
+            if self._owns_foreground(self._current_foreground_hwnd, hwnd):
+                break
+            self._fg_changed.wait(remaining)
+        return True
+    
     def _recover_window_focus(self, hwnd: int, window_id: str) -> bool:
-        """Attempt to recover focus to the target window"""
+        """Recover focus, or if another thread is already recovering, wait for and share its outcome"""
+        if not self._recovery_lock.acquire(blocking=False):
+            # Still stuck after the wait: don't report a stale result from an earlier recovery
+            if not self._recovery_lock.acquire(timeout=5.0):
+                return False
+            self._recovery_lock.release()
+            return self._last_recovery_result
+        
+        try:
+            self._last_recovery_result = self._run_focus_recovery(hwnd, window_id)
+            return self._last_recovery_result
+        finally:
+            self._recovery_lock.release()
+    
+    def _run_focus_recovery(self, hwnd: int, window_id: str) -> bool:
+        """Attempt to recover focus to the target window, trying the historically best method first"""
         
-        self.console.print(f"[cyan]🔄 Attempting focus recovery for window {window_id}[/cyan]")
+        self._log(f"[cyan]🔄 Attempting focus recovery for window {window_id}[/cyan]")
         
         try:
-            # Method 1: Use smart_foreground (minimize/maximize trick)
-            focus_success, focus_message = self.app_controller.gui_api.controller.wm.smart_foreground(hwnd)
-            
-            if focus_success:
-                self.console.print(f"[green]✅ Smart foreground successful: {focus_message}[/green]")
-                
-                # Wait for focus animation
-                time.sleep(2)
-                
-                # Verify focus was restored
-                if self._is_window_foreground(hwnd):
-                    self.console.print(f"[green]✅ Focus recovery successful[/green]")
+            for method_name in self._ordered_focus_methods():
+                if getattr(self, FOCUS_METHODS[method_name])(hwnd, window_id):
+                    self._log(f"[green]✅ Focus recovery successful[/green]")
                     self.focus_failure_count = 0
+                    self._record_focus_method_success(method_name)
                     
                     # Refresh window coordinates after focus recovery
-                    self._refresh_window_coordinates_after_focus(window_id)
+                    self._refresh_window_coordinates_after_focus(window_id, hwnd)
                     
                     return True
-                else:
-                    self.console.print(f"[yellow]⚠️ Smart foreground sent but window still not focused[/yellow]")
-                    return self._try_alternative_focus_methods(hwnd, window_id)
-            else:
-                self.console.print(f"[red]❌ Smart foreground failed: {focus_message}[/red]")
-                return self._try_alternative_focus_methods(hwnd, window_id)
+            
+            # All methods failed
+            return self._handle_focus_failure("all_methods_failed")
                 
         except Exception as e:
-            self.console.print(f"[red]❌ Focus recovery exception: {e}[/red]")
+            self._log(f"[red]❌ Focus recovery exception: {e}[/red]")
             return self._handle_focus_failure("recovery_exception", str(e))
     
-    def _try_alternative_focus_methods(self, hwnd: int, window_id: str) -> bool:
-        """Try alternative methods to restore window focus"""
+    def _focus_via_smart_foreground(self, hwnd: int, window_id: str) -> bool:
+        """Use smart_foreground (minimize/maximize trick)"""
+        focus_success, focus_message = self.app_controller.gui_api.controller.wm.smart_foreground(hwnd)
+        
+        if not focus_success:
+            self._log(f"[red]❌ Smart foreground failed: {focus_message}[/red]")
+            return False
+        
+        self._log(f"[green]✅ Smart foreground successful: {focus_message}[/green]")
+        self._fg_cache = (0.0, None)
+        
+        # Wait (up to 2s) for focus animation and verify focus was restored
+        if self._wait_for_foreground(hwnd, 2.0):
+            return True
+        self._log(f"[yellow]⚠️ Smart foreground sent but window still not focused[/yellow]")
+        return False
+    
+    def _focus_via_focus_command(self, hwnd: int, window_id: str) -> bool:
+        """Regular focus command"""
+        if self.app_controller.gui_api.focus_window(window_id) and self._wait_for_foreground(hwnd, 1.0):
+            self._log(f"[green]✅ Regular focus command worked[/green]")
+            return True
+        return False
+    
+    def _focus_via_title_bar_click(self, hwnd: int, window_id: str) -> bool:
+        """Click on window to focus it"""
+        self._log(f"[cyan]🖱️ Attempting focus via window click[/cyan]")
         
-        self.console.print(f"[cyan]🔄 Trying alternative focus methods[/cyan]")
+        # Geometry is at most WINDOW_INFO_TTL old, so moves nobody reported can't leave a stale point
+        window_info = self._get_window_info_cached(window_id)
+        if not window_info:
+            return False
         
+        window_data = window_info['window_data']
+        self.app_controller.gui_api.click(*self._title_bar_point(window_data['position'], window_data['size']))
+        
+        if self._wait_for_foreground(hwnd, 1.0):
+            self._log(f"[green]✅ Click focus method worked[/green]")
+            return True
+        return False
+    
+    def _focus_methods_path(self) -> Optional[Path]:
+        """Per-app file holding how often each recovery method worked"""
+        app_info = self.app_controller.current_app_info
+        if not app_info or 'folder_paths' not in app_info:
+            return None
+        return Path(app_info['folder_paths']['app_dir']) / "focus_methods.json"
+    
+    def _focus_method_counts(self) -> Dict[str, int]:
+        """Success counts for the current app, loaded from disk on first use"""
+        app_name = (self.app_controller.current_app_info or {}).get('app_name', '')
+        counts = self._method_success.get(app_name)
+        if counts is None:
+            counts = {}
+            path = self._focus_methods_path()
+            if path and path.exists():
+                try:
+                    counts = json.loads(path.read_text(encoding='utf-8'))
+                except (OSError, ValueError) as e:
+                    self._log(f"[yellow]⚠️ Could not load focus method stats: {e}[/yellow]")
+            self._method_success[app_name] = counts
+        return counts
+    
+    def _ordered_focus_methods(self) -> List[str]:
+        """Recovery methods by descending past success for this app (default order breaks ties)"""
+        counts = self._focus_method_counts()
+        return sorted(FOCUS_METHODS, key=lambda name: -counts.get(name, 0))
+    
+    def _record_focus_method_success(self, method_name: str) -> None:
+        """Count a winning method and write the stats through to disk"""
+        counts = self._focus_method_counts()
+        counts[method_name] = counts.get(method_name, 0) + 1
+        path = self._focus_methods_path()
+        if not path:
+            return
         try:
-            # Method 2: Regular focus command
-            if self.app_controller.gui_api.focus_window(window_id):
-                time.sleep(1)
-                if self._is_window_foreground(hwnd):
-                    self.console.print(f"[green]✅ Regular focus command worked[/green]")
-                    self.focus_failure_count = 0
-                    return True
-            
-            # Method 3: Click on window to focus it
-            self.console.print(f"[cyan]🖱️ Attempting focus via window click[/cyan]")
-            window_info = self.app_controller.gui_api.get_window_info(window_id)
-            if window_info:
-                pos = window_info['window_data']['position']
-                size = window_info['window_data']['size']
-                
-                # Click in the center of the window title bar area
-                center_x = pos['x'] + size['width'] // 2
-                title_bar_y = pos['y'] + 20  # Approximate title bar location
-                
-                self.app_controller.gui_api.click(center_x, title_bar_y)
-                time.sleep(1)
-                
-                if self._is_window_foreground(hwnd):
-                    self.console.print(f"[green]✅ Click focus method worked[/green]")
-                    self.focus_failure_count = 0
-                    return True
-            
-            # All methods failed
-            return self._handle_focus_failure("all_methods_failed")
-            
-        except Exception as e:
-            self.console.print(f"[red]❌ Alternative focus methods failed: {e}[/red]")
-            return self._handle_focus_failure("alternative_methods_exception", str(e))
+            path.write_text(json.dumps(counts), encoding='utf-8')
+        except OSError as e:
+            self._log(f"[yellow]⚠️ Could not save focus method stats: {e}[/yellow]")
+    
+    def clear_memoization(self) -> None:
+        """Forget recovery-method stats for the current app (e.g. after an app update)"""
+        app_name = (self.app_controller.current_app_info or {}).get('app_name', '')
+        self._method_success.pop(app_name, None)
+        path = self._focus_methods_path()
+        if path and path.exists():
+            path.unlink()
+    
+    def _get_window_rect_fast(self, hwnd: int) -> Optional[Dict]:
+        """Window geometry straight from GetWindowRect, shaped like last_known_position"""
+        try:
+            left, top, right, bottom = win32gui.GetWindowRect(hwnd)
+            return {'x': left, 'y': top, 'width': right - left, 'height': bottom - top}
+        except Exception:
+            return None
     
-    def _refresh_window_coordinates_after_focus(self, window_id: str) -> None:
+    def _refresh_window_coordinates_after_focus(self, window_id: str, hwnd: int) -> None:
         """Refresh window coordinates after focus recovery"""
         
-        self.console.print(f"[cyan]🔄 Refreshing coordinates after focus recovery[/cyan]")
+        # Geometry unchanged: skip the full window-table refresh and its settle sleep
+        rect = self._get_window_rect_fast(hwnd)
+        known = self.last_known_position
+        if rect and known and all(abs(rect[key] - known[key]) <= POSITION_TOLERANCE for key in rect):
+            return
+        
+        self._log(f"[cyan]🔄 Refreshing coordinates after focus recovery[/cyan]")
         
         try:
             # Force refresh of window API
@@ -179,24 +510,31 @@ class WindowFocusManager:
             time.sleep(0.5)
             
             # Get fresh window coordinates
-            fresh_window_info = self.app_controller.gui_api.get_window_info(window_id)
+            fresh_window_info = self._get_window_info_cached(window_id, refresh=True)
             if fresh_window_info:
-                pos = fresh_window_info['window_data']['position']
-                size = fresh_window_info['window_data']['size']
+                window_data = fresh_window_info['window_data']
+                pos = window_data['position']
+                size = window_data['size']
                 
-                self.console.print(f"[green]📍 Fresh coordinates: ({pos['x']}, {pos['y']}) size {size['width']}×{size['height']}[/green]")
+                self._log(f"[green]📍 Fresh coordinates: ({pos['x']}, {pos['y']}) size {size['width']}×{size['height']}[/green]")
                 self._update_window_state_tracking(fresh_window_info)
             else:
-                self.console.print(f"[yellow]⚠️ Could not get fresh coordinates after focus recovery[/yellow]")
+                self._log(f"[yellow]⚠️ Could not get fresh coordinates after focus recovery[/yellow]")
                 
         except Exception as e:
-            self.console.print(f"[yellow]⚠️ Coordinate refresh failed: {e}[/yellow]")
+            self._log(f"[yellow]⚠️ Coordinate refresh failed: {e}[/yellow]")
+    
+    @staticmethod
+    def _title_bar_point(pos: Dict, size: Dict) -> Tuple[int, int]:
+        """Center of the window title bar area"""
+        return pos['x'] + size['width'] // 2, pos['y'] + 20  # Approximate title bar location
     
     def _update_window_state_tracking(self, window_info: Dict) -> None:
         """Update our tracking of the window state"""
         try:
-            pos = window_info['window_data']['position']
-            size = window_info['window_data']['size']
+            window_data = window_info['window_data']
+            pos = window_data['position']
+            size = window_data['size']
             
             self.last_known_position = {
                 'x': pos['x'],
@@ -206,46 +544,73 @@ class WindowFocusManager:
             }
             
             # Also track window title if available
-            if 'title' in window_info['window_data']:
-                self.expected_window_title = window_info['window_data']['title']
+            title = window_data.get('title')
+            if title is not None:
+                self.expected_window_title = title
                 
         except Exception as e:
-            self.console.print(f"[yellow]⚠️ Window state tracking update failed: {e}[/yellow]")
+            self._log(f"[yellow]⚠️ Window state tracking update failed: {e}[/yellow]")
     
     def _handle_focus_failure(self, failure_type: str, details: str = "") -> bool:
         """Handle focus failure with recovery options"""
         
         self.focus_failure_count += 1
-        self.console.print(f"[red]❌ Focus failure #{self.focus_failure_count}: {failure_type} {details}[/red]")
+        # The window may be gone or replaced - look it up again next time
+        self._hwnd_by_window_id.pop(self.expected_window_id, None)
+        self._log(f"[red]❌ Focus failure #{self.focus_failure_count}: {failure_type} {details}[/red]")
         
         if not self.auto_recovery_enabled:
             return False
             
         if self.focus_failure_count >= self.max_focus_failures:
-            self.console.print(f"[red]💥 Max focus failures reached ({self.max_focus_failures}) - disabling focus verification[/red]")
+            self._log(f"[red]💥 Max focus failures reached ({self.max_focus_failures}) - disabling focus verification[/red]")
             self.focus_verification_enabled = False
             return False
         
         # Try to restart the app as last resort
         if failure_type in ["window_not_found", "all_methods_failed"]:
-            self.console.print(f"[cyan]🔄 Attempting app restart to recover focus[/cyan]")
+            self._log(f"[cyan]🔄 Attempting app restart to recover focus[/cyan]")
             try:
                 if hasattr(self.app_controller, '_restart_app_for_exploration'):
                     restart_success = self.app_controller._restart_app_for_exploration()
                     if restart_success:
-                        self.console.print(f"[green]✅ App restart successful - focus recovered[/green]")
+                        self._log(f"[green]✅ App restart successful - focus recovered[/green]")
                         self.focus_failure_count = 0
                         return True
                 else:
-                    self.console.print(f"[yellow]⚠️ App restart method not available[/yellow]")
+                    self._log(f"[yellow]⚠️ App restart method not available[/yellow]")
             except Exception as e:
-                self.console.print(f"[red]❌ App restart failed: {e}[/red]")
+                self._log(f"[red]❌ App restart failed: {e}[/red]")
         
         return False
     
+    def _reset_check_interval(self) -> None:
+        """Interaction is happening - go back to the baseline check interval"""
+        self._consecutive_stable = 0
+        self._current_check_interval = self.focus_check_interval
+    
+    def expect_focus_change(self, duration_s: float = 3.0) -> None:
+        """Suspend focus checks/recovery for duration_s while an action deliberately moves focus"""
+        self._expect_focus_change_until = time.monotonic() + duration_s
+    
+    def _recently_verified(self) -> bool:
+        """True if focus was confirmed within the last RECENTLY_VERIFIED seconds"""
+        return time.monotonic() - self._last_verified_monotonic < RECENTLY_VERIFIED
+    
+    def invalidate_focus_cache(self) -> None:
+        """Forget recent focus confirmations - call after actions that may move focus (shortcuts opening dialogs etc.)"""
+        self._last_verified_monotonic = 0.0
+        self._fg_cache = (0.0, None)
+    
     def prepare_for_screenshot(self) -> bool:
         """Ensure window is focused before taking a screenshot"""
-        self.console.print(f"[cyan]📸 Preparing window for screenshot[/cyan]")
+        self._reset_check_interval()
+        
+        # Back-to-back prepare calls: the previous one already verified and settled
+        if self._recently_verified():
+            return True
+        
+        self._log(f"[cyan]📸 Preparing window for screenshot[/cyan]")
         
         # Always force check before screenshots
         success = self.ensure_target_window_focused(force_check=True)
@@ -253,15 +618,21 @@ class WindowFocusManager:
         if success:
             # Extra wait for any window animations to complete
             time.sleep(0.5)
-            self.console.print(f"[green]✅ Window ready for screenshot[/green]")
+            self._last_verified_monotonic = time.monotonic()
+            self._log(f"[green]✅ Window ready for screenshot[/green]")
         else:
-            self.console.print(f"[red]❌ Failed to prepare window for screenshot[/red]")
+            self._log(f"[red]❌ Failed to prepare window for screenshot[/red]")
             
         return success
     
     def prepare_for_interaction(self) -> bool:
         """Ensure window is focused before any click interaction"""
-        self.console.print(f"[cyan]🖱️ Preparing window for interaction[/cyan]")
+        self._reset_check_interval()
+        
+        if self._recently_verified():
+            return True
+        
+        self._log(f"[cyan]🖱️ Preparing window for interaction[/cyan]")
         
         # Always force check before interactions
         success = self.ensure_target_window_focused(force_check=True)
@@ -269,19 +640,20 @@ class WindowFocusManager:
         if success:
             # Extra wait for focus to stabilize
             time.sleep(0.3)
-            self.console.print(f"[green]✅ Window ready for interaction[/green]")
+            self._last_verified_monotonic = time.monotonic()
+            self._log(f"[green]✅ Window ready for interaction[/green]")
         else:
-            self.console.print(f"[red]❌ Failed to prepare window for interaction[/red]")
+            self._log(f"[red]❌ Failed to prepare window for interaction[/red]")
             
         return success
     
-    def get_focus_status_summary(self) -> Dict:
+    def get_focus_status_summary(self) -> FocusStatus:
         """Get summary of current focus management status"""
-        return {
-            "focus_verification_enabled": self.focus_verification_enabled,
-            "auto_recovery_enabled": self.auto_recovery_enabled,
-            "focus_failure_count": self.focus_failure_count,
-            "max_focus_failures": self.max_focus_failures,
-            "expected_window_id": self.expected_window_id,
-            "last_known_position": self.last_known_position
-        } 
\ No newline at end of file
+        status = self._status
+        status.focus_verification_enabled = self.focus_verification_enabled
+        status.auto_recovery_enabled = self.auto_recovery_enabled
+        status.focus_failure_count = self.focus_failure_count
+        status.max_focus_failures = self.max_focus_failures
+        status.expected_window_id = self.expected_window_id
+        status.last_known_position = self.last_known_position
+        return status 
\ No newline at end of file